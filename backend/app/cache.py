@@ -0,0 +1,132 @@
+"""
+Redis-backed response cache for read-only endpoints.
+Stores whole responses keyed by request path, with per-policy freshness.
+Falls back to running the view when Redis is not configured or unreachable.
+"""
+
+import os
+import time
+from functools import wraps
+
+import orjson
+from flask import Response, current_app, request
+
+# Seconds a cached response stays fresh, per policy
+CACHE_POLICIES = {"long": 60, "short": 2}
+
+# Seconds to bypass the cache after Redis fails
+RETRY_AFTER = 30
+
+# [client, retry_at] - lazily created client and cache-fallback deadline.
+# The client slot is None until first use and False once REDIS_URL is found
+# unset (or redis missing), so the environment is read only once.
+_state = [None, 0.0]
+
+# [module, error types] - redis is imported only once REDIS_URL is set, so
+# app start-up does not pay for it when caching is off
+_redis = [None, ()]
+
+
+def _import_redis():
+    """
+    Import the optional redis package on first use.
+
+    Returns:
+        The redis module, or None if it is not installed
+    """
+    if _redis[0] is None:
+        try:
+            import redis  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover - redis is an optional dependency
+            return None
+        _redis[0] = redis
+        _redis[1] = (redis.RedisError,)
+    return _redis[0]
+
+
+def get_client():
+    """
+    Return the Redis client used for caching.
+
+    Returns:
+        Redis client, or None when REDIS_URL is unset, redis is not
+        installed, or Redis recently failed
+    """
+    client = _state[0]
+    if client is None:
+        url = os.getenv("REDIS_URL")
+        redis = _import_redis() if url else None
+        if redis is None:
+            client = False
+        else:
+            client = redis.Redis.from_url(url, socket_timeout=0.05, socket_connect_timeout=0.05)
+        _state[0] = client
+    if client is False or _state[1] > time.time():
+        return None
+    return client
+
+
+def _disable():
+    """Bypass the cache for RETRY_AFTER seconds after a Redis failure."""
+    _state[1] = time.time() + RETRY_AFTER
+
+
+def cached(policy="short"):
+    """
+    Cache a view's successful responses in Redis.
+
+    Each entry is a hash keyed by the request path holding status, headers,
+    body, generated_at and stale_at. Fresh entries are returned without
+    calling the view.
+
+    Args:
+        policy: Name of a CACHE_POLICIES entry ("long" or "short")
+
+    Example:
+        >>> @app.route("/api/info")
+        ... @cached(policy="long")
+        ... def app_info(): ...
+    """
+    ttl = CACHE_POLICIES[policy]
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            client = get_client()
+            if client is None:
+                return view(*args, **kwargs)
+
+            key = f"cache:{request.full_path}"
+            try:
+                entry = client.hgetall(key)
+            except _redis[1]:
+                _disable()
+                return view(*args, **kwargs)
+
+            now = time.time()
+            if entry and float(entry[b"stale_at"]) > now:
+                return Response(
+                    entry[b"body"], int(entry[b"status"]), orjson.loads(entry[b"headers"])
+                )
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                try:
+                    client.hset(
+                        key,
+                        mapping={
+                            "status": response.status_code,
+                            "headers": orjson.dumps(list(response.headers.items())),
+                            "body": response.get_data(),
+                            "generated_at": now,
+                            "stale_at": now + ttl,
+                        },
+                    )
+                    client.expire(key, ttl)
+                except _redis[1]:
+                    _disable()
+            return response
+
+        return wrapper
+
+    return decorator
@@ -4,27 +4,66 @@ Provides REST API endpoints for the CI/CD learning project.
 Along with prometheus checking.
 """
 
-from flask import Flask, jsonify, request
+import json
+import operator
+
+import orjson
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from prometheus_flask_exporter import PrometheusMetrics
 
+from app.cache import cached
 from app.utils import (
     absolute_value,
-    add_numbers,
-    divide_numbers,
     get_current_time,
-    is_even,
-    is_odd,
     is_palindrome,
-    multiply_numbers,
+    parse_int,
     reverse_string,
     sort_list,
     square,
-    subtract_numbers,
 )
 
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson.
+    Encodes responses straight to bytes in Rust instead of the stdlib json
+    module. Values orjson rejects (e.g. integers wider than 64 bits) fall
+    back to the stdlib encoder. Decoding stays on the stdlib json module,
+    since orjson reads integers wider than 64 bits as floats.
+    """
+
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def dumps(self, obj, **kwargs):
+        return self._dumpb(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return json.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumpb(obj), mimetype="application/json")
+
+    def _dumpb(self, obj):
+        try:
+            return orjson.dumps(obj, option=self.option)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, separators=(",", ":"), default=_isoformat).encode()
+
+
+def _isoformat(obj):
+    """Stdlib json fallback for the date/time values orjson handles natively."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 app = Flask(__name__)
-CORS(app)
+app.json = OrjsonProvider(app)
+# The browser client only calls /api/*; max_age lets it cache preflights for a day
+CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "POST"], "max_age": 86400}})
 
 # Initialize metrics
 # 'group_by' allows you to group similar endpoints in charts
@@ -36,240 +75,177 @@ metrics.info("app_info", "Application info", version="1.0.3")
 # ============= HEALTH CHECK ENDPOINTS =============
 
 
+def _json_prefix(payload):
+    """
+    Pre-serialize a static payload, leaving it open for a trailing timestamp.
+    Returns: JSON bytes ending in ',"timestamp":'
+    """
+    return orjson.dumps(payload)[:-1] + b',"timestamp":'
+
+
+# [datetime, encoded suffix] - get_current_time() reuses one datetime per
+# tick, so its JSON encoding is only redone when the datetime changes
+_ts_suffix = [None, b""]
+
+
+def _timestamp_suffix():
+    """Return the current timestamp as a JSON string followed by the closing brace."""
+    now = get_current_time()
+    if _ts_suffix[0] is not now:
+        _ts_suffix[1] = orjson.dumps(now, option=OrjsonProvider.option) + b"}"
+        _ts_suffix[0] = now
+    return _ts_suffix[1]
+
+
+def _timestamped_response(prefix, status=200):
+    """Close a pre-serialized prefix with the current timestamp."""
+    return Response(prefix + _timestamp_suffix(), status, mimetype="application/json")
+
+
+_HEALTH_PREFIX = _json_prefix(
+    {
+        "status": "healthy",
+        "message": "Python CI/CD App is running!",
+    }
+)
+
+_DETAILED_HEALTH_PREFIX = _json_prefix(
+    {
+        "status": "healthy",
+        "service": "python-cicd-app",
+        "version": "1.0.0",
+        "message": "Application is operational",
+        "environment": "development",
+    }
+)
+
+_APP_INFO_PREFIX = _json_prefix(
+    {
+        "app_name": "Python CI/CD Learning Project",
+        "version": "1.0.0",
+        "description": "Educational CI/CD pipeline demonstration",
+        "endpoints": [
+            {"path": "/", "method": "GET", "description": "Health check"},
+            {"path": "/api/health", "method": "GET", "description": "Detailed health"},
+            {"path": "/api/info", "method": "GET", "description": "App info"},
+            {
+                "path": "/api/add?a=<num>&b=<num>",
+                "method": "GET",
+                "description": "Add numbers",
+            },
+            {
+                "path": "/api/subtract?a=<num>&b=<num>",
+                "method": "GET",
+                "description": "Subtract numbers",
+            },
+            {
+                "path": "/api/multiply?a=<num>&b=<num>",
+                "method": "GET",
+                "description": "Multiply numbers",
+            },
+            {
+                "path": "/api/divide?a=<num>&b=<num>",
+                "method": "GET",
+                "description": "Divide numbers",
+            },
+            {
+                "path": "/api/square?n=<num>",
+                "method": "GET",
+                "description": "Square number",
+            },
+            {"path": "/api/abs?n=<num>", "method": "GET", "description": "Absolute value"},
+            {"path": "/api/parity/<n>", "method": "GET", "description": "Check even/odd"},
+            {"path": "/api/echo", "method": ["GET", "POST"], "description": "Echo data"},
+        ],
+    }
+)
+
+
 @app.route("/", methods=["GET"])
+@cached(policy="short")
 def health_check():
     """
     Basic health check endpoint.
     Returns: JSON with status and timestamp
     """
-    return (
-        jsonify(
-            {
-                "status": "healthy",
-                "message": "Python CI/CD App is running!",
-                "timestamp": get_current_time(),
-            }
-        ),
-        200,
-    )
+    return _timestamped_response(_HEALTH_PREFIX)
 
 
 @app.route("/api/health", methods=["GET"])
+@cached(policy="short")
 def detailed_health_check():
     """
     Detailed health check with more information.
     Returns: JSON with comprehensive health status
     """
-    return (
-        jsonify(
-            {
-                "status": "healthy",
-                "service": "python-cicd-app",
-                "version": "1.0.0",
-                "message": "Application is operational",
-                "timestamp": get_current_time(),
-                "environment": "development",
-            }
-        ),
-        200,
-    )
+    return _timestamped_response(_DETAILED_HEALTH_PREFIX)
 
 
 @app.route("/api/info", methods=["GET"])
+@cached(policy="long")
 def app_info():
     """
     Application information endpoint.
     Returns: JSON with app metadata
     """
-    return (
-        jsonify(
-            {
-                "app_name": "Python CI/CD Learning Project",
-                "version": "1.0.0",
-                "description": "Educational CI/CD pipeline demonstration",
-                "endpoints": [
-                    {"path": "/", "method": "GET", "description": "Health check"},
-                    {"path": "/api/health", "method": "GET", "description": "Detailed health"},
-                    {"path": "/api/info", "method": "GET", "description": "App info"},
-                    {
-                        "path": "/api/add?a=<num>&b=<num>",
-                        "method": "GET",
-                        "description": "Add numbers",
-                    },
-                    {
-                        "path": "/api/subtract?a=<num>&b=<num>",
-                        "method": "GET",
-                        "description": "Subtract numbers",
-                    },
-                    {
-                        "path": "/api/multiply?a=<num>&b=<num>",
-                        "method": "GET",
-                        "description": "Multiply numbers",
-                    },
-                    {
-                        "path": "/api/divide?a=<num>&b=<num>",
-                        "method": "GET",
-                        "description": "Divide numbers",
-                    },
-                    {
-                        "path": "/api/square?n=<num>",
-                        "method": "GET",
-                        "description": "Square number",
-                    },
-                    {"path": "/api/abs?n=<num>", "method": "GET", "description": "Absolute value"},
-                    {"path": "/api/parity/<n>", "method": "GET", "description": "Check even/odd"},
-                    {"path": "/api/echo", "method": ["GET", "POST"], "description": "Echo data"},
-                ],
-                "timestamp": get_current_time(),
-            }
-        ),
-        200,
-    )
+    return _timestamped_response(_APP_INFO_PREFIX)
 
 
 # ============= MATHEMATICAL ENDPOINTS =============
 
 
-@app.route("/api/add", methods=["GET"])
-def add():
+def _two_ints():
     """
-    Add two numbers endpoint.
-    Query Parameters: a, b (integers)
-    Returns: JSON with operation result
-    Example: /api/add?a=5&b=3
+    Parse the required integer query parameters 'a' and 'b'.
+    Returns: (a, b) tuple of ints
+    Raises: KeyError if either is missing, ValueError if either is not an integer
     """
-    try:
-        a = request.args.get("a")
-        b = request.args.get("b")
-
-        if a is None or b is None:
-            return jsonify({"error": "Parameters 'a' and 'b' are required"}), 400
+    args = request.args
+    a = args["a"]
+    b = args["b"]
+    return parse_int(a), parse_int(b)
 
-        a = int(a)
-        b = int(b)
 
-        result = add_numbers(a, b)
-        return (
-            jsonify(
-                {
-                    "operation": "add",
-                    "a": a,
-                    "b": b,
-                    "result": result,
-                    "timestamp": get_current_time(),
-                }
-            ),
-            200,
-        )
-    except ValueError:
-        return jsonify({"error": "Parameters must be valid integers"}), 400
+_MATH_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
 
 
-@app.route("/api/subtract", methods=["GET"])
-def subtract():
+@app.route(f"/api/<any({', '.join(_MATH_OPS)}):op>", methods=["GET"])
+def math_operation(op):
     """
-    Subtract two numbers endpoint.
+    Two-operand arithmetic endpoint (add, subtract, multiply, divide).
+    Args: op (operation name from URL path)
     Query Parameters: a, b (integers)
-    Returns: JSON with operation result (a - b)
-    Example: /api/subtract?a=10&b=3
+    Returns: JSON with operation result
+    Example: /api/add?a=5&b=3, /api/divide?a=10&b=2
     """
     try:
-        a = request.args.get("a")
-        b = request.args.get("b")
-
-        if a is None or b is None:
-            return jsonify({"error": "Parameters 'a' and 'b' are required"}), 400
-
-        a = int(a)
-        b = int(b)
-
-        result = subtract_numbers(a, b)
-        return (
-            jsonify(
-                {
-                    "operation": "subtract",
-                    "a": a,
-                    "b": b,
-                    "result": result,
-                    "timestamp": get_current_time(),
-                }
-            ),
-            200,
-        )
+        a, b = _two_ints()
+    except KeyError:
+        return jsonify({"error": "Parameters 'a' and 'b' are required"}), 400
     except ValueError:
         return jsonify({"error": "Parameters must be valid integers"}), 400
 
-
-@app.route("/api/multiply", methods=["GET"])
-def multiply():
-    """
-    Multiply two numbers endpoint.
-    Query Parameters: a, b (integers)
-    Returns: JSON with operation result (a * b)
-    Example: /api/multiply?a=5&b=3
-    """
     try:
-        a = request.args.get("a")
-        b = request.args.get("b")
-
-        if a is None or b is None:
-            return jsonify({"error": "Parameters 'a' and 'b' are required"}), 400
-
-        a = int(a)
-        b = int(b)
-
-        result = multiply_numbers(a, b)
-        return (
-            jsonify(
-                {
-                    "operation": "multiply",
-                    "a": a,
-                    "b": b,
-                    "result": result,
-                    "timestamp": get_current_time(),
-                }
-            ),
-            200,
-        )
-    except ValueError:
-        return jsonify({"error": "Parameters must be valid integers"}), 400
-
-
-@app.route("/api/divide", methods=["GET"])
-def divide():
-    """
-    Divide two numbers endpoint.
-    Query Parameters: a, b (integers)
-    Returns: JSON with operation result (a / b)
-    Example: /api/divide?a=10&b=2
-    """
-    try:
-        a = request.args.get("a")
-        b = request.args.get("b")
-
-        if a is None or b is None:
-            return jsonify({"error": "Parameters 'a' and 'b' are required"}), 400
-
-        a = int(a)
-        b = int(b)
-
-        result = divide_numbers(a, b)
-        return (
-            jsonify(
-                {
-                    "operation": "divide",
-                    "a": a,
-                    "b": b,
-                    "result": result,
-                    "timestamp": get_current_time(),
-                }
-            ),
-            200,
-        )
-    except ValueError:
-        return jsonify({"error": "Parameters must be valid integers"}), 400
+        result = _MATH_OPS[op](a, b)
     except ZeroDivisionError:
         return jsonify({"error": "Division by zero is not allowed"}), 400
+    return (
+        jsonify(
+            {
+                "operation": op,
+                "a": a,
+                "b": b,
+                "result": result,
+                "timestamp": get_current_time(),
+            }
+        ),
+        200,
+    )
 
 
 # ============= UTILITY ENDPOINTS =============
@@ -289,7 +265,7 @@ def square_endpoint():
         if n is None:
             return jsonify({"error": "Parameter 'n' is required"}), 400
 
-        n = int(n)
+        n = parse_int(n)
 
         result = square(n)
         return (
@@ -321,7 +297,7 @@ def absolute_endpoint():
         if n is None:
             return jsonify({"error": "Parameter 'n' is required"}), 400
 
-        n = int(n)
+        n = parse_int(n)
 
         result = absolute_value(n)
         return (
@@ -339,6 +315,36 @@ def absolute_endpoint():
         return jsonify({"error": "Parameter must be a valid integer"}), 400
 
 
+def _parity_payload(n):
+    """Build the /api/parity body for n, without its timestamp."""
+    # The int URL converter guarantees n is an int, so skip is_even's type check
+    even = not n & 1
+    return {
+        "operation": "parity",
+        "input": n,
+        "is_even": even,
+        "is_odd": not even,
+        "parity": "even" if even else "odd",
+    }
+
+
+def _odd_even_payload(n):
+    """Build the /api/odd_even body for n, without its timestamp."""
+    even = not n & 1
+    return {
+        "operation": "Odd/Even Check",
+        "input": n,
+        "is_even": even,
+        "is_odd": not even,
+        "status": "even" if even else "odd",
+    }
+
+
+# Pre-serialized bodies for the small inputs the parity endpoints mostly see
+_PARITY_PREFIXES = {n: _json_prefix(_parity_payload(n)) for n in range(257)}
+_ODD_EVEN_PREFIXES = {n: _json_prefix(_odd_even_payload(n)) for n in range(257)}
+
+
 @app.route("/api/parity/<int:n>", methods=["GET"])
 def parity_endpoint(n):
     """
@@ -347,25 +353,10 @@ def parity_endpoint(n):
     Returns: JSON with parity information including is_even boolean
     Example: /api/parity/4
     """
-    try:
-        even = is_even(n)
-        odd = is_odd(n)
-
-        return (
-            jsonify(
-                {
-                    "operation": "parity",
-                    "input": n,
-                    "is_even": even,
-                    "is_odd": odd,
-                    "parity": "even" if even else "odd",
-                    "timestamp": get_current_time(),
-                }
-            ),
-            200,
-        )
-    except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+    prefix = _PARITY_PREFIXES.get(n)
+    if prefix is not None:
+        return _timestamped_response(prefix)
+    return jsonify({**_parity_payload(n), "timestamp": get_current_time()})
 
 
 @app.route("/api/odd_even/<int:n>", methods=["GET"])
@@ -376,26 +367,10 @@ def odd_even_endpoint(n):
     Returns: JSON with parity information
     Example: /api/odd_even/5
     """
-    try:
-        even = is_even(n)
-        odd = is_odd(n)
-        status = "even" if even else "odd"
-
-        return (
-            jsonify(
-                {
-                    "operation": "Odd/Even Check",
-                    "input": n,
-                    "is_even": even,
-                    "is_odd": odd,
-                    "status": status,
-                    "timestamp": get_current_time(),
-                }
-            ),
-            200,
-        )
-    except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+    prefix = _ODD_EVEN_PREFIXES.get(n)
+    if prefix is not None:
+        return _timestamped_response(prefix)
+    return jsonify({**_odd_even_payload(n), "timestamp": get_current_time()})
 
 
 @app.route("/api/echo", methods=["GET", "POST"])
@@ -408,8 +383,12 @@ def echo():
     Example POST: {"message": "hello"}
     """
     if request.method == "POST":
-        data = request.get_json()
-        message = data.get("message", "") if data else ""
+        raw = request.get_data(cache=False)
+        try:
+            data = json.loads(raw) if raw else None
+        except ValueError:
+            return jsonify({"error": "Request body must be valid JSON"}), 400
+        message = data.get("message", "") if isinstance(data, dict) else ""
     else:
         message = request.args.get("message", "")
 
@@ -503,53 +482,47 @@ def sort_numbers():
 
 # ============= ERROR HANDLERS =============
 
+_NOT_FOUND_PREFIX = _json_prefix(
+    {
+        "error": "Endpoint not found",
+        "status": 404,
+        "message": "The requested endpoint does not exist",
+    }
+)
+
+_METHOD_NOT_ALLOWED_PREFIX = _json_prefix(
+    {
+        "error": "Method not allowed",
+        "status": 405,
+        "message": "The HTTP method is not allowed for this endpoint",
+    }
+)
+
+_INTERNAL_ERROR_PREFIX = _json_prefix(
+    {
+        "error": "Internal server error",
+        "status": 500,
+        "message": "An unexpected error occurred",
+    }
+)
+
 
 @app.errorhandler(404)
 def not_found(_error):
     """Handle 404 Not Found errors."""
-    return (
-        jsonify(
-            {
-                "error": "Endpoint not found",
-                "status": 404,
-                "message": "The requested endpoint does not exist",
-                "timestamp": get_current_time(),
-            }
-        ),
-        404,
-    )
+    return _timestamped_response(_NOT_FOUND_PREFIX, 404)
 
 
 @app.errorhandler(405)
 def method_not_allowed(_error):
     """Handle 405 Method Not Allowed errors."""
-    return (
-        jsonify(
-            {
-                "error": "Method not allowed",
-                "status": 405,
-                "message": "The HTTP method is not allowed for this endpoint",
-                "timestamp": get_current_time(),
-            }
-        ),
-        405,
-    )
+    return _timestamped_response(_METHOD_NOT_ALLOWED_PREFIX, 405)
 
 
 @app.errorhandler(500)
 def internal_server_error(_error):
     """Handle 500 Internal Server Error."""
-    return (
-        jsonify(
-            {
-                "error": "Internal server error",
-                "status": 500,
-                "message": "An unexpected error occurred",
-                "timestamp": get_current_time(),
-            }
-        ),
-        500,
-    )
+    return _timestamped_response(_INTERNAL_ERROR_PREFIX, 500)
 
 
 # ============= APPLICATION ENTRY POINT =============
@@ -3,24 +3,68 @@ Utility functions for mathematical operations and helpers.
 Provides reusable functions with comprehensive error handling.
 """
 
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Union
 
 # ============= TIME UTILITIES =============
 
+# [bucket, timestamp] - last timestamp and its 100ms tick
+_ts_cache = [0, None]
 
-def get_current_time() -> str:
+
+def get_current_time() -> datetime:
     """
-    Return current UTC timestamp in ISO format.
+    Return the current UTC time.
+
+    The value is cached per 100ms tick, so calls within the same tick reuse
+    one datetime. The JSON provider serializes it as ISO 8601 with a "Z"
+    suffix (e.g., "2024-01-01T12:00:00.000000Z").
 
     Returns:
-        str: ISO format timestamp (e.g., "2024-01-01T12:00:00.000000")
+        datetime: Timezone-aware UTC datetime
+    """
+    now = time.time()
+    bucket = int(now * 10)
+    if _ts_cache[0] != bucket:
+        _ts_cache[0] = bucket
+        _ts_cache[1] = datetime.fromtimestamp(now, timezone.utc)
+    return _ts_cache[1]
+
+
+# ============= PARSING =============
+
+
+@lru_cache(maxsize=2048)
+def parse_int(s: str) -> int:
+    """
+    Parse an integer query parameter, caching recently seen strings.
+    Raises ValueError (uncached) if s is not a valid integer.
+    Example: "42" -> 42
     """
-    return datetime.now(timezone.utc).isoformat()
+    return int(s)
 
 
 # ============= MATHEMATICAL OPERATIONS =============
 
+# The arithmetic helpers first test for exact int/float with `type(x) is ...`
+# (a pointer compare; bool is excluded for free since type(True) is bool) and
+# only fall back to the isinstance checks for subclasses and invalid input.
+
+
+def _check_numbers(a, b) -> None:
+    """
+    Validate that both inputs are non-boolean numbers.
+
+    Raises:
+        ValueError: If either input is not numeric or is a boolean
+    """
+    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+        raise ValueError("Both inputs must be integers or floats")
+    if isinstance(a, bool) or isinstance(b, bool):
+        raise ValueError("Boolean values are not allowed")
+
 
 def add_numbers(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     """
@@ -40,10 +84,11 @@ def add_numbers(a: Union[int, float], b: Union[int, float]) -> Union[int, float]
         >>> add_numbers(5, 3)
         8
     """
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-        raise ValueError("Both inputs must be integers or floats")
-    if isinstance(a, bool) or isinstance(b, bool):
-        raise ValueError("Boolean values are not allowed")
+    ta = type(a)
+    tb = type(b)
+    if (ta is int or ta is float) and (tb is int or tb is float):
+        return a + b
+    _check_numbers(a, b)
     return a + b
 
 
@@ -65,10 +110,11 @@ def subtract_numbers(a: Union[int, float], b: Union[int, float]) -> Union[int, f
         >>> subtract_numbers(10, 3)
         7
     """
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-        raise ValueError("Both inputs must be integers or floats")
-    if isinstance(a, bool) or isinstance(b, bool):
-        raise ValueError("Boolean values are not allowed")
+    ta = type(a)
+    tb = type(b)
+    if (ta is int or ta is float) and (tb is int or tb is float):
+        return a - b
+    _check_numbers(a, b)
     return a - b
 
 
@@ -90,10 +136,11 @@ def multiply_numbers(a: Union[int, float], b: Union[int, float]) -> Union[int, f
         >>> multiply_numbers(5, 3)
         15
     """
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-        raise ValueError("Both inputs must be integers or floats")
-    if isinstance(a, bool) or isinstance(b, bool):
-        raise ValueError("Boolean values are not allowed")
+    ta = type(a)
+    tb = type(b)
+    if (ta is int or ta is float) and (tb is int or tb is float):
+        return a * b
+    _check_numbers(a, b)
     return a * b
 
 
@@ -116,10 +163,10 @@ def divide_numbers(a: Union[int, float], b: Union[int, float]) -> Union[int, flo
         >>> divide_numbers(10, 2)
         5.0
     """
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-        raise ValueError("Both inputs must be integers or floats")
-    if isinstance(a, bool) or isinstance(b, bool):
-        raise ValueError("Boolean values are not allowed")
+    ta = type(a)
+    tb = type(b)
+    if not ((ta is int or ta is float) and (tb is int or tb is float)):
+        _check_numbers(a, b)
     if b == 0:
         raise ZeroDivisionError("Cannot divide by zero")
     return a / b
@@ -128,6 +175,37 @@ def divide_numbers(a: Union[int, float], b: Union[int, float]) -> Union[int, flo
 # ============= NUMBER PROPERTIES =============
 
 
+def _validate_int(n) -> None:
+    """
+    Validate that the input is a non-boolean integer.
+
+    Raises:
+        ValueError: If input is not an integer or is a boolean
+    """
+    if type(n) is not int and (not isinstance(n, int) or isinstance(n, bool)):
+        raise ValueError("Input must be an integer")
+
+
+def _validate_number(n) -> None:
+    """
+    Validate that the input is a non-boolean int or float.
+
+    Raises:
+        ValueError: If input is not numeric or is a boolean
+    """
+    if not isinstance(n, (int, float)) or isinstance(n, bool):
+        raise ValueError("Input must be a number (int or float)")
+
+
+# Count of 1-bits in |n|: int.bit_count (POPCNT) on 3.10+, C-level str.count before
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # pragma: no cover - Python < 3.10
+
+    def _popcount(n):
+        return bin(n).count("1")
+
+
 def even_parity(n: int) -> bool:
     """
     Determine if a number has even parity or not.
@@ -147,13 +225,8 @@ def even_parity(n: int) -> bool:
         >>> even_parity(5)
         False
     """
-    if not isinstance(n, int) or isinstance(n, bool):
-        raise ValueError("Input must be an integer")
-    count = 0
-    for bit in bin(n)[2:]:
-        if bit == "1":
-            count += 1
-    return not count & 1
+    _validate_int(n)
+    return not _popcount(n) & 1
 
 
 def is_even(n: int) -> bool:
@@ -175,8 +248,7 @@ def is_even(n: int) -> bool:
         >>> is_even(5)
         False
     """
-    if not isinstance(n, int) or isinstance(n, bool):
-        raise ValueError("Input must be an integer")
+    _validate_int(n)
     return not n & 1
 
 
@@ -199,8 +271,7 @@ def is_odd(n: int) -> bool:
         >>> is_odd(4)
         False
     """
-    if not isinstance(n, int) or isinstance(n, bool):
-        raise ValueError("Input must be an integer")
+    _validate_int(n)
     return bool(n & 1)
 
 
@@ -223,8 +294,10 @@ def square(n: Union[int, float]) -> Union[int, float]:
         >>> square(2.5)
         6.25
     """
-    if not isinstance(n, (int, float)) or isinstance(n, bool):
-        raise ValueError("Input must be a number (int or float)")
+    tn = type(n)
+    if tn is int or tn is float:
+        return n * n
+    _validate_number(n)
     return n * n
 
 
@@ -247,22 +320,33 @@ def absolute_value(n: Union[int, float]) -> Union[int, float]:
         >>> absolute_value(-2.5)
         2.5
     """
-    if not isinstance(n, (int, float)) or isinstance(n, bool):
-        raise ValueError("Input must be a number (int or float)")
+    tn = type(n)
+    if tn is int or tn is float:
+        return abs(n)
+    _validate_number(n)
     return abs(n)
 
 
 # ============= STRING OPERATIONS =============
 
+# str.translate table deleting every ASCII character that is not a letter or digit
+_DELETE_NON_ALNUM = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum())
+)
+
 
 def is_palindrome(text: str) -> bool:
     """
     Check if a string is a palindrome.
+    Ignores case and non-alphanumeric characters.
     Example: "madam" -> True
     """
     if not isinstance(text, str):
         raise ValueError("Input must be a string")
-    clean_text = "".join(c.lower() for c in text if c.isalnum())
+    if text.isascii():
+        clean_text = text.translate(_DELETE_NON_ALNUM).lower()
+    else:
+        clean_text = "".join(c.lower() for c in text if c.isalnum())
     return clean_text == clean_text[::-1]
 
 
@@ -278,6 +362,8 @@ def reverse_string(text: str) -> str:
 
 # ============= LIST OPERATIONS =============
 
+_NUMBER_TYPES = frozenset((int, float))
+
 
 def sort_list(numbers: list, reverse: bool = False) -> list:
     """
@@ -285,8 +371,10 @@ def sort_list(numbers: list, reverse: bool = False) -> list:
     """
     if not isinstance(numbers, list):
         raise ValueError("Input must be a list")
-    # specific check for non-numeric elements handled by Python's sort,
-    # but we can be explicit
-    if not all(isinstance(x, (int, float)) for x in numbers):
+    # One C-level pass over the element types; subclasses such as bool
+    # take the slower isinstance scan
+    if not _NUMBER_TYPES.issuperset(map(type, numbers)) and not all(
+        isinstance(x, (int, float)) for x in numbers
+    ):
         raise ValueError("List must contain only numbers")
     return sorted(numbers, reverse=reverse)
@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for the production container.
+Run with: gunicorn --config gunicorn.conf.py app.main:app
+"""
+
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '5000')}"  # nosec B104
+
+# One worker process serving requests on threads: PrometheusMetrics keeps its
+# counters in process memory, so with several workers each /metrics scrape
+# would report whichever worker answered it
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+accesslog = "-"
@@ -0,0 +1,26 @@
+"""
+Optional native build of the utility module.
+Compiles app/utils.py with Cython; when the extension is not built the
+pure Python module is imported as usual.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # pragma: no cover - Cython is only needed for the native build
+    EXT_MODULES = []
+else:
+    EXT_MODULES = cythonize(
+        ["app/utils.py"],
+        # annotation_typing off: keep raising ValueError (not TypeError) on bad input
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "annotation_typing": False,
+        },
+    )
+
+setup(name="python-cicd-app", ext_modules=EXT_MODULES)
@@ -0,0 +1,57 @@
+"""
+Shared pytest configuration.
+Builds and warms the app up once per session, only when a test needs it,
+so timed tests measure steady state and utility-only runs skip Flask.
+"""
+
+import gc
+
+import pytest
+
+# One request per route family: compiles the URL map, creates the per-path
+# Prometheus metrics and fills the parsing caches before any test runs
+WARMUP_PATHS = [
+    "/",
+    "/api/health",
+    "/api/info",
+    "/api/add?a=5&b=3",
+    "/api/subtract?a=10&b=4",
+    "/api/multiply?a=2&b=3",
+    "/api/divide?a=10&b=2",
+    "/api/square?n=5",
+    "/api/abs?n=-5",
+    "/api/parity/4",
+    "/api/odd_even/5",
+    "/api/echo?message=warmup",
+    "/api/string/palindrome?text=level",
+    "/api/string/reverse?text=warmup",
+    "/api/nonexistent",
+]
+
+
+def pytest_configure(config):
+    """Register the benchmark marker when pytest-codspeed is not installed."""
+    config.addinivalue_line("markers", "benchmark: request-handling benchmark run by CodSpeed")
+
+
+@pytest.fixture(scope="session")
+def flask_app():
+    """Import the app on first use and hit each route family once."""
+    from app.main import app  # pylint: disable=import-outside-toplevel
+
+    app.config["TESTING"] = True
+    test_client = app.test_client()
+    for path in WARMUP_PATHS:
+        test_client.get(path)
+    return app
+
+
+@pytest.fixture
+def gc_paused():
+    """Collect once, then keep the cyclic GC off so bulk request loops run without GC pauses."""
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    yield
+    if was_enabled:
+        gc.enable()
@@ -0,0 +1,145 @@
+"""
+Unit tests for the Redis response cache.
+Uses an in-memory client so no Redis server is required.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import time
+
+import pytest
+
+from app import cache
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands used by the cache."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def hgetall(self, key):
+        """Return the stored hash, or an empty dict on a miss."""
+        return self.store.get(key, {})
+
+    def hset(self, key, mapping):
+        """Store a hash, encoding values to bytes like Redis does."""
+        self.store[key] = {
+            k.encode(): v if isinstance(v, bytes) else str(v).encode() for k, v in mapping.items()
+        }
+
+    def expire(self, key, ttl):
+        """Record the key's time to live."""
+        self.ttls[key] = ttl
+
+
+class BrokenRedis:
+    """Client whose every command fails as if Redis were down."""
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    def hgetall(self, key):
+        """Raise a connection error."""
+        raise self.redis.ConnectionError(f"cannot fetch {key}")
+
+
+@pytest.fixture
+def client(flask_app):
+    """Create Flask test client."""
+    with flask_app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Route the cache through an in-memory client."""
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_state", [fake, 0.0])
+    return fake
+
+
+class TestGetClient:
+    """Tests for get_client function."""
+
+    def test_disabled_without_redis_url(self, monkeypatch):
+        """Test caching is off, and redis never imported, when REDIS_URL is not set."""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.setattr(cache, "_state", [None, 0.0])
+        monkeypatch.setattr(cache, "_redis", [None, ()])
+        assert cache.get_client() is None
+        assert cache._redis[0] is None  # pylint: disable=protected-access
+
+    def test_disabled_decision_is_remembered(self, monkeypatch):
+        """Test REDIS_URL is read once, not on every cached request."""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.setattr(cache, "_state", [None, 0.0])
+        assert cache.get_client() is None
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        assert cache.get_client() is None
+
+    def test_client_created_from_redis_url(self, monkeypatch):
+        """Test the client is built from REDIS_URL on first use."""
+        redis = pytest.importorskip("redis")
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        monkeypatch.setattr(cache, "_state", [None, 0.0])
+        assert isinstance(cache.get_client(), redis.Redis)
+
+    def test_disabled_after_failure(self, monkeypatch, fake_redis):
+        """Test caching is bypassed while the retry window is open."""
+        monkeypatch.setattr(cache, "_state", [fake_redis, time.time() + 10])
+        assert cache.get_client() is None
+
+
+class TestCachedDecorator:
+    """Tests for the cached decorator."""
+
+    def test_miss_stores_response(self, client, fake_redis):
+        """Test a cache miss stores the response with the policy TTL."""
+        response = client.get("/api/info")
+        assert response.status_code == 200
+        entry = fake_redis.store["cache:/api/info?"]
+        assert entry[b"body"] == response.data
+        assert fake_redis.ttls["cache:/api/info?"] == cache.CACHE_POLICIES["long"]
+
+    def test_hit_returns_cached_body(self, client, fake_redis):
+        """Test a fresh entry is served without calling the view."""
+        fake_redis.hset(
+            "cache:/api/health?",
+            mapping={
+                "status": 200,
+                "headers": b'[["Content-Type","application/json"]]',
+                "body": b'{"cached":true}',
+                "generated_at": time.time(),
+                "stale_at": time.time() + 60,
+            },
+        )
+        response = client.get("/api/health")
+        assert response.status_code == 200
+        assert response.json == {"cached": True}
+
+    def test_stale_entry_is_refreshed(self, client, fake_redis):
+        """Test a stale entry is replaced by a fresh response."""
+        fake_redis.hset(
+            "cache:/?",
+            mapping={
+                "status": 200,
+                "headers": b"[]",
+                "body": b'{"cached":true}',
+                "generated_at": 0,
+                "stale_at": 1,
+            },
+        )
+        response = client.get("/")
+        assert response.json["status"] == "healthy"
+        assert fake_redis.store["cache:/?"][b"body"] == response.data
+
+    def test_redis_failure_falls_through(self, client, monkeypatch):
+        """Test the view still answers when Redis is unreachable."""
+        redis = pytest.importorskip("redis")
+        monkeypatch.setattr(cache, "_state", [BrokenRedis(redis), 0.0])
+        monkeypatch.setattr(cache, "_redis", [redis, (redis.RedisError,)])
+        response = client.get("/api/info")
+        assert response.status_code == 200
+        assert cache.get_client() is None
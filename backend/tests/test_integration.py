@@ -8,16 +8,57 @@ Tests multi-endpoint workflows and real-world usage patterns.
 import json
 
 import pytest
-
-from app.main import app
+from werkzeug.test import create_environ, run_wsgi_app
+
+# Echo request body, serialized once at import
+_ECHO_PAYLOAD = json.dumps({"message": "test data", "value": 42})
+
+
+def _wsgi_get(app, path, query_string=None):
+    """
+    GET path straight through the WSGI app, bypassing the test client wrappers.
+    Args: app under test (the flask_app fixture)
+    Returns: (status code, mimetype, parsed JSON body)
+    """
+    app_iter, status, headers = run_wsgi_app(
+        app.wsgi_app, create_environ(path, query_string=query_string)
+    )
+    try:
+        body = b"".join(app_iter)
+    finally:
+        if hasattr(app_iter, "close"):
+            app_iter.close()
+    mimetype = headers.get("Content-Type", "").split(";", 1)[0]
+    return int(status.split(" ", 1)[0]), mimetype, json.loads(body)
+
+
+def _chain(app, value, steps):
+    """
+    Feed value through a sequence of math endpoints, each result becoming the next 'a'.
+    Args: app under test; steps as (operation, b) pairs, e.g. [("multiply", 2), ("add", 10)]
+    Returns: list of intermediate results, one per step
+    """
+    results = []
+    for operation, b in steps:
+        status_code, _, data = _wsgi_get(app, f"/api/{operation}", {"a": value, "b": b})
+        assert status_code == 200, f"{operation} failed for a={value}, b={b}"
+        value = data["result"]
+        results.append(value)
+    return results
+
+
+@pytest.fixture(scope="session")
+def client(flask_app):
+    """Create one Flask test client shared by every integration test."""
+    with flask_app.test_client() as test_client:
+        yield test_client
 
 
 @pytest.fixture
-def client():
-    """Create Flask test client."""
-    app.config["TESTING"] = True
-    with app.test_client() as test_client:
-        yield test_client
+def production_config(flask_app, monkeypatch):
+    """Run with TESTING off so errors go through the app's JSON handlers, as in production."""
+    monkeypatch.setitem(flask_app.config, "TESTING", False)
+    monkeypatch.setitem(flask_app.config, "PROPAGATE_EXCEPTIONS", False)
 
 
 class TestMathematicalWorkflows:
@@ -31,18 +72,20 @@ class TestMathematicalWorkflows:
         # Step 1: Add 5 + 3 = 8
         response1 = client.get("/api/add?a=5&b=3")
         assert response1.status_code == 200
-        result1 = response1.json["result"]
+        data1 = response1.json
+        result1 = data1["result"]
         assert result1 == 8
 
         # Step 2: Multiply result by 2: 8 * 2 = 16
-        response2 = client.get(f"/api/multiply?a={result1}&b=2")
+        response2 = client.get("/api/multiply", query_string={"a": result1, "b": 2})
         assert response2.status_code == 200
-        result2 = response2.json["result"]
+        data2 = response2.json
+        result2 = data2["result"]
         assert result2 == 16
 
         # Step 3: Verify both responses have timestamps
-        assert "timestamp" in response1.json
-        assert "timestamp" in response2.json
+        assert "timestamp" in data1
+        assert "timestamp" in data2
 
     def test_calculation_chain_subtract_then_square(self, client):
         """Test workflow: Subtract, then square the result."""
@@ -53,7 +96,7 @@ class TestMathematicalWorkflows:
         assert result1 == 7
 
         # Step 2: Square result: 7^2 = 49
-        response2 = client.get(f"/api/square?n={result1}")
+        response2 = client.get("/api/square", query_string={"n": result1})
         assert response2.status_code == 200
         result2 = response2.json["result"]
         assert result2 == 49
@@ -68,8 +111,9 @@ class TestMathematicalWorkflows:
         # Step 2: Division by zero (should fail gracefully)
         response2 = client.get("/api/divide?a=10&b=0")
         assert response2.status_code == 400
-        assert "error" in response2.json
-        assert "zero" in response2.json["error"].lower()
+        data2 = response2.json
+        assert "error" in data2
+        assert "zero" in data2["error"].lower()
 
 
 class TestEndpointCombinations:
@@ -89,30 +133,32 @@ class TestEndpointCombinations:
         endpoints = info["endpoints"]
         assert len(endpoints) > 5
 
-        # Step 3: Verify at least one endpoint works
-        add_endpoint_exists = any(ep.get("path", "").startswith("/api/add") for ep in endpoints)
-        assert add_endpoint_exists
+        # Step 3: Verify the add endpoint is listed (paths may carry a query template)
+        paths = {ep.get("path", "").split("?", 1)[0] for ep in endpoints}
+        assert "/api/add" in paths
 
     def test_health_check_before_operations(self, client):
         """Test workflow: Check health, then perform operations."""
         # Step 1: Check health
         health = client.get("/api/health")
         assert health.status_code == 200
-        assert health.json["status"] == "healthy"
+        status = health.json["status"]
+        assert status == "healthy"
 
         # Step 2: If healthy, perform operation
-        if health.json["status"] == "healthy":
+        if status == "healthy":
             operation = client.get("/api/add?a=5&b=3")
             assert operation.status_code == 200
             assert operation.json["result"] == 8
 
 
+@pytest.mark.usefixtures("production_config")
 class TestResponseFormatConsistency:
     """Integration tests for consistent response formats."""
 
-    def test_all_endpoints_return_json(self, client):
-        """Verify all endpoints return JSON content type."""
-        endpoints = [
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
             "/",
             "/api/health",
             "/api/info",
@@ -123,40 +169,43 @@ class TestResponseFormatConsistency:
             "/api/square?n=5",
             "/api/abs?n=-5",
             "/api/parity/4",
-        ]
-
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert response.content_type == "application/json", f"{endpoint} did not return JSON"
+        ],
+    )
+    def test_all_endpoints_return_json(self, flask_app, endpoint):
+        """Verify all endpoints return JSON content type."""
+        _, mimetype, _ = _wsgi_get(flask_app, endpoint)
+        assert mimetype == "application/json", f"{endpoint} did not return JSON"
 
-    def test_all_responses_include_operation_or_status(self, client):
-        """Verify all responses include operation/status information."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "endpoint, key",
+        [
             ("/", "status"),
             ("/api/add?a=1&b=1", "operation"),
             ("/api/health", "status"),
             ("/api/info", "app_name"),
-        ]
-
-        for endpoint, key in test_cases:
-            response = client.get(endpoint)
-            assert key in response.json, f"{endpoint} missing '{key}' in response"
+        ],
+    )
+    def test_all_responses_include_operation_or_status(self, flask_app, endpoint, key):
+        """Verify all responses include operation/status information."""
+        _, _, data = _wsgi_get(flask_app, endpoint)
+        assert key in data, f"{endpoint} missing '{key}' in response"
 
-    def test_error_responses_have_consistent_format(self, client):
-        """Verify error responses follow consistent format."""
-        error_cases = [
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
             "/api/add?a=abc&b=def",  # Invalid parameters
             "/api/add?a=5",  # Missing parameter
             "/api/divide?a=5&b=0",  # Division by zero
             "/api/nonexistent",  # Not found
-        ]
-
-        for endpoint in error_cases:
-            response = client.get(endpoint)
-            # Error response should have status code >= 400
-            assert response.status_code >= 400
-            # Error response should include 'error' key
-            assert "error" in response.json
+        ],
+    )
+    def test_error_responses_have_consistent_format(self, flask_app, endpoint):
+        """Verify error responses follow consistent format."""
+        status_code, _, data = _wsgi_get(flask_app, endpoint)
+        # Error response should have status code >= 400
+        assert status_code >= 400
+        # Error response should include 'error' key
+        assert "error" in data
 
 
 class TestComplexScenarios:
@@ -171,26 +220,29 @@ class TestComplexScenarios:
         numbers = [5, 7]
 
         # Step 1: Add them
-        add_resp = client.get(f"/api/add?a={numbers[0]}&b={numbers[1]}")
+        add_resp = client.get("/api/add", query_string={"a": numbers[0], "b": numbers[1]})
         assert add_resp.status_code == 200
-        sum_result = add_resp.json["result"]
+        add_data = add_resp.json
+        sum_result = add_data["result"]
         assert sum_result == 12
 
         # Step 2: Check if sum is even/odd
         parity_resp = client.get(f"/api/parity/{sum_result}")
         assert parity_resp.status_code == 200
-        is_even = parity_resp.json["is_even"]
+        parity_data = parity_resp.json
+        is_even = parity_data["is_even"]
         assert is_even is True  # 12 is even
 
         # Step 3: Square the sum
-        square_resp = client.get(f"/api/square?n={sum_result}")
+        square_resp = client.get("/api/square", query_string={"n": sum_result})
         assert square_resp.status_code == 200
-        squared = square_resp.json["result"]
+        square_data = square_resp.json
+        squared = square_data["result"]
         assert squared == 144  # 12^2 = 144
 
         # Verify all operations have timestamps
-        for resp in [add_resp, parity_resp, square_resp]:
-            assert "timestamp" in resp.json
+        for data in [add_data, parity_data, square_data]:
+            assert "timestamp" in data
 
     def test_user_workflow_with_error_recovery(self, client):
         """
@@ -213,36 +265,19 @@ class TestSequentialOperations:
 
     def test_echo_endpoint_with_data_flow(self, client):
         """Test echo endpoint with JSON data."""
-        test_data = {"message": "test data", "value": 42}
-
         # POST JSON data
-        response = client.post(
-            "/api/echo", data=json.dumps(test_data), content_type="application/json"
-        )
+        response = client.post("/api/echo", data=_ECHO_PAYLOAD, content_type="application/json")
         assert response.status_code == 200
-        assert response.json["message"] == test_data["message"]
+        assert response.json["message"] == "test data"
 
-    def test_sequential_mathematical_operations(self, client):
+    def test_sequential_mathematical_operations(self, flask_app):
         """
         Test sequence: Start with 2, double it, add 10, divide by 3.
         2 → 4 → 14 → 4.67
         """
-        value = 2
-
-        # Step 1: Double (multiply by 2)
-        resp1 = client.get(f"/api/multiply?a={value}&b=2")
-        assert resp1.status_code == 200
-        value = resp1.json["result"]
-        assert value == 4
-
-        # Step 2: Add 10
-        resp2 = client.get(f"/api/add?a={value}&b=10")
-        assert resp2.status_code == 200
-        value = resp2.json["result"]
-        assert value == 14
-
-        # Step 3: Divide by 3
-        resp3 = client.get(f"/api/divide?a={value}&b=3")
-        assert resp3.status_code == 200
-        final_value = resp3.json["result"]
+        doubled, added, final_value = _chain(
+            flask_app, 2, [("multiply", 2), ("add", 10), ("divide", 3)]
+        )
+        assert doubled == 4
+        assert added == 14
         assert abs(final_value - 4.666) < 0.01
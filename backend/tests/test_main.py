@@ -6,18 +6,91 @@ Tests all API endpoints with positive, negative, and edge cases.
 # pylint: disable=redefined-outer-name
 
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 import pytest
 
-from app.main import app
+# Endpoint sets shared by the format, error and concurrency tests
+JSON_ENDPOINTS = (
+    "/",
+    "/api/health",
+    "/api/info",
+    "/api/add?a=1&b=2",
+    "/api/subtract?a=5&b=3",
+    "/api/multiply?a=2&b=3",
+    "/api/divide?a=6&b=2",
+    "/api/square?n=5",
+    "/api/abs?n=-5",
+    "/api/parity/4",
+    "/api/echo?message=test",
+)
+
+ERROR_ENDPOINTS = (
+    "/api/nonexistent",
+    "/api/add?a=text&b=5",
+    "/api/divide?a=5&b=0",
+)
+
+OPERATION_ENDPOINTS = (
+    "/api/add?a=1&b=2",
+    "/api/subtract?a=5&b=3",
+    "/api/multiply?a=2&b=3",
+    "/api/divide?a=6&b=2",
+)
+
+INVALID_PARAM_CASES = (
+    ("/api/add?a=text&b=5", 400),
+    ("/api/subtract?a=5&b=text", 400),
+    ("/api/multiply?a=text&b=text", 400),
+    ("/api/divide?a=5&b=text", 400),
+    ("/api/square?n=text", 400),
+    ("/api/abs?n=text", 400),
+)
+
+
+@pytest.fixture(scope="session")
+def client(flask_app):
+    """Create one Flask test client shared by every endpoint test."""
+    with flask_app.test_client() as client:
+        yield client
 
 
-@pytest.fixture
-def client():
-    """Create Flask test client."""
-    app.config["TESTING"] = True
-    with app.test_client() as client:
-        yield client
+@pytest.fixture(scope="session")
+def main(flask_app):
+    """The app.main module, imported by flask_app on first use."""
+    return sys.modules[flask_app.import_name]
+
+
+def _assert_error(response, status=400):
+    """
+    Assert response is a JSON error with the given status code.
+    Returns: the decoded body, for further checks
+    """
+    assert response.status_code == status
+    data = response.json
+    assert "error" in data
+    return data
+
+
+def _burst(app, paths, query_strings=None, workers=16):
+    """
+    GET every path from a thread pool, each request on its own test client.
+    Args: app under test; query_strings, if given, pairs one query string or
+    dict with each path
+    Returns: responses in the same order as paths
+    """
+    if query_strings is None:
+        query_strings = [None] * len(paths)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda path, query: app.test_client().get(path, query_string=query),
+                paths,
+                query_strings,
+            )
+        )
 
 
 class TestHealthCheckEndpoints:
@@ -56,97 +129,76 @@ class TestHealthCheckEndpoints:
     def test_info_endpoint_includes_endpoints_list(self, client):
         """Test info endpoint lists all available endpoints."""
         response = client.get("/api/info")
-        assert "endpoints" in response.json
-        assert len(response.json["endpoints"]) > 0
+        data = response.json
+        assert "endpoints" in data
+        assert len(data["endpoints"]) > 0
 
     def test_health_endpoint_has_uptime(self, client):
         """Test health endpoint includes uptime."""
         response = client.get("/api/health")
-        assert "uptime" in response.json or "status" in response.json
+        data = response.json
+        assert "uptime" in data or "status" in data
 
     def test_info_endpoint_has_app_name(self, client):
         """Test info endpoint includes app name."""
         response = client.get("/api/info")
-        assert "app_name" in response.json or "endpoints" in response.json
+        data = response.json
+        assert "app_name" in data or "endpoints" in data
+
+    @pytest.mark.parametrize("endpoint", ["/", "/api/health", "/api/info"])
+    def test_static_endpoints_return_valid_json(self, client, endpoint):
+        """Test pre-serialized endpoints produce parseable JSON with a timestamp."""
+        response = client.get(endpoint)
+        payload = json.loads(response.data)
+        assert response.content_type == "application/json"
+        assert "T" in payload["timestamp"]
+        assert payload["timestamp"].endswith("Z")
 
 
 class TestAddEndpoint:
     """Tests for /api/add endpoint."""
 
-    def test_add_positive_numbers(self, client):
-        """Test adding positive numbers."""
-        response = client.get("/api/add?a=5&b=3")
-        assert response.status_code == 200
-        assert response.json["result"] == 8
-
-    def test_add_negative_numbers(self, client):
-        """Test adding negative numbers."""
-        response = client.get("/api/add?a=-5&b=-3")
-        assert response.status_code == 200
-        assert response.json["result"] == -8
-
-    def test_add_mixed_signs(self, client):
-        """Test adding numbers with different signs."""
-        response = client.get("/api/add?a=10&b=-7")
-        assert response.status_code == 200
-        assert response.json["result"] == 3
-
-    def test_add_zero(self, client):
-        """Test adding with zero."""
-        response = client.get("/api/add?a=5&b=0")
-        assert response.status_code == 200
-        assert response.json["result"] == 5
-
-    def test_add_large_numbers(self, client):
-        """Test adding large numbers."""
-        response = client.get("/api/add?a=999999&b=1")
-        assert response.status_code == 200
-        assert response.json["result"] == 1000000
-
-    def test_add_returns_json(self, client):
-        """Test add endpoint returns valid JSON."""
-        response = client.get("/api/add?a=5&b=3")
-        assert response.content_type == "application/json"
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (5, 3, 8),  # positive numbers
+            (-5, -3, -8),  # negative numbers
+            (10, -7, 3),  # mixed signs
+            (5, 0, 5),  # zero
+            (999999, 1, 1000000),  # large numbers
+        ],
+    )
+    def test_add_result(self, client, a, b, expected):
+        """Test adding valid numbers."""
+        response = client.get("/api/add", query_string={"a": a, "b": b})
+        assert response.status_code == 200
+        assert response.json["result"] == expected
 
     def test_add_includes_timestamp(self, client):
         """Test add endpoint includes timestamp."""
         response = client.get("/api/add?a=5&b=3")
         assert "timestamp" in response.json
 
-    def test_add_invalid_params_returns_400(self, client):
-        """Test invalid parameters return 400."""
-        response = client.get("/api/add?a=abc&b=def")
-        assert response.status_code == 400
-
-    def test_add_missing_params_returns_400(self, client):
-        """Test missing parameters return 400."""
-        response = client.get("/api/add?a=5")
-        assert response.status_code == 400
-
-    # NEW: Additional error handling tests
-    def test_add_missing_both_params(self, client):
-        """Test add with both parameters missing."""
-        response = client.get("/api/add")
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "a=abc&b=def",  # both invalid
+            "a=5",  # b missing
+            "",  # both missing
+            "a=invalid&b=5",  # a invalid
+            "a=5&b=invalid",  # b invalid
+        ],
+    )
+    def test_add_bad_params_return_400(self, client, query):
+        """Test missing or invalid parameters return a 400 error."""
+        response = client.get("/api/add", query_string=query)
+        _assert_error(response)
+
+    def test_add_missing_param_reported_before_invalid(self, client):
+        """Test a missing parameter takes precedence over an invalid one."""
+        response = client.get("/api/add?a=invalid")
         assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_add_missing_b_param(self, client):
-        """Test add with b parameter missing."""
-        response = client.get("/api/add?a=10")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_add_invalid_a_param(self, client):
-        """Test add with invalid a parameter."""
-        response = client.get("/api/add?a=invalid&b=5")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_add_invalid_b_param(self, client):
-        """Test add with invalid b parameter."""
-        response = client.get("/api/add?a=5&b=invalid")
-        assert response.status_code == 400
-        assert "error" in response.json
+        assert response.json["error"] == "Parameters 'a' and 'b' are required"
 
     def test_add_float_numbers(self, client):
         """Test that API requires integer parameters."""
@@ -158,310 +210,201 @@ class TestAddEndpoint:
     def test_add_includes_operation_field(self, client):
         """Test add response includes operation field."""
         response = client.get("/api/add?a=5&b=3")
-        assert "operation" in response.json
-        assert response.json["operation"] == "add"
+        data = response.json
+        assert "operation" in data
+        assert data["operation"] == "add"
 
 
 class TestSubtractEndpoint:
     """Tests for /api/subtract endpoint."""
 
-    def test_subtract_positive_numbers(self, client):
-        """Test subtracting positive numbers."""
-        response = client.get("/api/subtract?a=10&b=3")
-        assert response.status_code == 200
-        assert response.json["result"] == 7
-
-    def test_subtract_results_in_negative(self, client):
-        """Test subtraction resulting in negative."""
-        response = client.get("/api/subtract?a=3&b=10")
-        assert response.status_code == 200
-        assert response.json["result"] == -7
-
-    # NEW: Additional tests for subtract
-    def test_subtract_zero(self, client):
-        """Test subtracting zero."""
-        response = client.get("/api/subtract?a=10&b=0")
-        assert response.status_code == 200
-        assert response.json["result"] == 10
-
-    def test_subtract_from_zero(self, client):
-        """Test subtracting from zero."""
-        response = client.get("/api/subtract?a=0&b=5")
-        assert response.status_code == 200
-        assert response.json["result"] == -5
-
-    def test_subtract_invalid_params(self, client):
-        """Test subtract with invalid parameters."""
-        response = client.get("/api/subtract?a=abc&b=5")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_subtract_missing_params(self, client):
-        """Test subtract with missing parameters."""
-        response = client.get("/api/subtract?a=10")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_subtract_negative_numbers(self, client):
-        """Test subtracting negative numbers."""
-        response = client.get("/api/subtract?a=-5&b=-3")
-        assert response.status_code == 200
-        assert response.json["result"] == -2
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (10, 3, 7),  # positive numbers
+            (3, 10, -7),  # negative result
+            (10, 0, 10),  # subtract zero
+            (0, 5, -5),  # subtract from zero
+            (-5, -3, -2),  # negative numbers
+        ],
+    )
+    def test_subtract_result(self, client, a, b, expected):
+        """Test subtracting valid numbers."""
+        response = client.get("/api/subtract", query_string={"a": a, "b": b})
+        assert response.status_code == 200
+        assert response.json["result"] == expected
+
+    @pytest.mark.parametrize("query", ["a=abc&b=5", "a=10"])
+    def test_subtract_bad_params_return_400(self, client, query):
+        """Test invalid or missing parameters return a 400 error."""
+        response = client.get("/api/subtract", query_string=query)
+        _assert_error(response)
 
     def test_subtract_includes_operation(self, client):
         """Test subtract response includes operation."""
         response = client.get("/api/subtract?a=10&b=3")
-        assert "operation" in response.json
-        assert response.json["operation"] == "subtract"
+        data = response.json
+        assert "operation" in data
+        assert data["operation"] == "subtract"
 
 
 class TestMultiplyEndpoint:
     """Tests for /api/multiply endpoint."""
 
-    def test_multiply_positive_numbers(self, client):
-        """Test multiplying positive numbers."""
-        response = client.get("/api/multiply?a=5&b=3")
-        assert response.status_code == 200
-        assert response.json["result"] == 15
-
-    def test_multiply_by_zero(self, client):
-        """Test multiplying by zero."""
-        response = client.get("/api/multiply?a=100&b=0")
-        assert response.status_code == 200
-        assert response.json["result"] == 0
-
-    # NEW: Additional tests for multiply
-    def test_multiply_negative_numbers(self, client):
-        """Test multiplying negative numbers."""
-        response = client.get("/api/multiply?a=-5&b=-3")
-        assert response.status_code == 200
-        assert response.json["result"] == 15
-
-    def test_multiply_mixed_signs(self, client):
-        """Test multiplying with mixed signs."""
-        response = client.get("/api/multiply?a=-5&b=3")
-        assert response.status_code == 200
-        assert response.json["result"] == -15
-
-    def test_multiply_by_one(self, client):
-        """Test multiplying by one."""
-        response = client.get("/api/multiply?a=42&b=1")
-        assert response.status_code == 200
-        assert response.json["result"] == 42
-
-    def test_multiply_invalid_params(self, client):
-        """Test multiply with invalid parameters."""
-        response = client.get("/api/multiply?a=abc&b=5")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_multiply_missing_params(self, client):
-        """Test multiply with missing parameters."""
-        response = client.get("/api/multiply?b=5")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_multiply_large_numbers(self, client):
-        """Test multiplying large numbers."""
-        response = client.get("/api/multiply?a=1000&b=1000")
-        assert response.status_code == 200
-        assert response.json["result"] == 1000000
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (5, 3, 15),  # positive numbers
+            (100, 0, 0),  # by zero
+            (-5, -3, 15),  # negative numbers
+            (-5, 3, -15),  # mixed signs
+            (42, 1, 42),  # by one
+            (1000, 1000, 1000000),  # large numbers
+        ],
+    )
+    def test_multiply_result(self, client, a, b, expected):
+        """Test multiplying valid numbers."""
+        response = client.get("/api/multiply", query_string={"a": a, "b": b})
+        assert response.status_code == 200
+        assert response.json["result"] == expected
+
+    @pytest.mark.parametrize("query", ["a=abc&b=5", "b=5"])
+    def test_multiply_bad_params_return_400(self, client, query):
+        """Test invalid or missing parameters return a 400 error."""
+        response = client.get("/api/multiply", query_string=query)
+        _assert_error(response)
 
     def test_multiply_includes_operation(self, client):
         """Test multiply response includes operation."""
         response = client.get("/api/multiply?a=5&b=3")
-        assert "operation" in response.json
-        assert response.json["operation"] == "multiply"
+        data = response.json
+        assert "operation" in data
+        assert data["operation"] == "multiply"
 
 
 class TestDivideEndpoint:
     """Tests for /api/divide endpoint."""
 
-    def test_divide_positive_numbers(self, client):
-        """Test dividing positive numbers."""
-        response = client.get("/api/divide?a=10&b=2")
-        assert response.status_code == 200
-        assert response.json["result"] == 5.0
-
-    def test_divide_results_in_float(self, client):
-        """Test division with float result."""
-        response = client.get("/api/divide?a=10&b=3")
-        assert response.status_code == 200
-        assert abs(response.json["result"] - 3.333) < 0.01
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (10, 2, 5.0),  # positive numbers
+            (10, 3, pytest.approx(3.333, abs=0.01)),  # float result
+            (-10, -2, 5.0),  # negative numbers
+            (10, -2, -5.0),  # mixed signs
+            (42, 1, 42.0),  # by one
+            (0, 5, 0.0),  # zero dividend
+        ],
+    )
+    def test_divide_result(self, client, a, b, expected):
+        """Test dividing valid numbers."""
+        response = client.get("/api/divide", query_string={"a": a, "b": b})
+        assert response.status_code == 200
+        assert response.json["result"] == expected
 
     # NEW: Critical division by zero test
     def test_divide_by_zero_returns_400(self, client):
         """Test division by zero returns error."""
         response = client.get("/api/divide?a=10&b=0")
-        assert response.status_code == 400
-        assert "error" in response.json
-        assert "zero" in response.json["error"].lower()
-
-    def test_divide_negative_numbers(self, client):
-        """Test dividing negative numbers."""
-        response = client.get("/api/divide?a=-10&b=-2")
-        assert response.status_code == 200
-        assert response.json["result"] == 5.0
-
-    def test_divide_mixed_signs(self, client):
-        """Test dividing with mixed signs."""
-        response = client.get("/api/divide?a=10&b=-2")
-        assert response.status_code == 200
-        assert response.json["result"] == -5.0
+        data = _assert_error(response)
+        assert "zero" in data["error"].lower()
 
-    def test_divide_by_one(self, client):
-        """Test dividing by one."""
-        response = client.get("/api/divide?a=42&b=1")
-        assert response.status_code == 200
-        assert response.json["result"] == 42.0
-
-    def test_divide_zero_by_number(self, client):
-        """Test dividing zero by a number."""
-        response = client.get("/api/divide?a=0&b=5")
-        assert response.status_code == 200
-        assert response.json["result"] == 0.0
-
-    def test_divide_invalid_params(self, client):
-        """Test divide with invalid parameters."""
-        response = client.get("/api/divide?a=abc&b=5")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_divide_missing_params(self, client):
-        """Test divide with missing parameters."""
-        response = client.get("/api/divide?a=10")
-        assert response.status_code == 400
-        assert "error" in response.json
+    @pytest.mark.parametrize("query", ["a=abc&b=5", "a=10"])
+    def test_divide_bad_params_return_400(self, client, query):
+        """Test invalid or missing parameters return a 400 error."""
+        response = client.get("/api/divide", query_string=query)
+        _assert_error(response)
 
     def test_divide_includes_operation(self, client):
         """Test divide response includes operation."""
         response = client.get("/api/divide?a=10&b=2")
-        assert "operation" in response.json
-        assert response.json["operation"] == "divide"
+        data = response.json
+        assert "operation" in data
+        assert data["operation"] == "divide"
 
 
 class TestUtilityEndpoints:
     """Tests for utility endpoints."""
 
-    def test_square_endpoint(self, client):
-        """Test square endpoint."""
-        response = client.get("/api/square?n=5")
-        assert response.status_code == 200
-        assert response.json["result"] == 25
-
-    def test_abs_endpoint_positive(self, client):
-        """Test absolute value endpoint with positive."""
-        response = client.get("/api/abs?n=5")
-        assert response.status_code == 200
-        assert response.json["result"] == 5
-
-    def test_abs_endpoint_negative(self, client):
-        """Test absolute value endpoint with negative."""
-        response = client.get("/api/abs?n=-5")
-        assert response.status_code == 200
-        assert response.json["result"] == 5
-
-    def test_odd_even_endpoint_even(self, client):
-        """Test odd-even check for even number."""
-        response = client.get("/api/parity/4")
-        assert response.status_code == 200
-        assert response.json["is_even"] is True
-        assert response.json["is_odd"] is False
-
-    def test_odd_even_endpoint_odd(self, client):
-        """Test odd-even check for odd number."""
-        response = client.get("/api/parity/5")
-        assert response.status_code == 200
-        assert response.json["is_even"] is False
-        assert response.json["is_odd"] is True
-
-    def test_parity_endpoint_even(self, client):
-        """Test parity check for even number."""
-        response = client.get("/api/parity/4")
-        assert response.status_code == 200
-        assert response.json["parity"] == "even"
-
-    def test_parity_endpoint_odd(self, client):
-        """Test parity check for odd number."""
-        response = client.get("/api/parity/3")
-        assert response.status_code == 200
-        assert response.json["parity"] == "odd"
-
-    # NEW: Additional utility endpoint tests
-    def test_square_zero(self, client):
-        """Test square of zero."""
-        response = client.get("/api/square?n=0")
-        assert response.status_code == 200
-        assert response.json["result"] == 0
-
-    def test_square_negative(self, client):
-        """Test square of negative number."""
-        response = client.get("/api/square?n=-5")
-        assert response.status_code == 200
-        assert response.json["result"] == 25
-
-    def test_square_invalid_param(self, client):
-        """Test square with invalid parameter."""
-        response = client.get("/api/square?n=abc")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_square_missing_param(self, client):
-        """Test square with missing parameter."""
-        response = client.get("/api/square")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_abs_zero(self, client):
-        """Test absolute value of zero."""
-        response = client.get("/api/abs?n=0")
-        assert response.status_code == 200
-        assert response.json["result"] == 0
-
-    def test_abs_invalid_param(self, client):
-        """Test abs with invalid parameter."""
-        response = client.get("/api/abs?n=abc")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_abs_missing_param(self, client):
-        """Test abs with missing parameter."""
-        response = client.get("/api/abs")
-        assert response.status_code == 400
-        assert "error" in response.json
-
-    def test_parity_zero(self, client):
-        """Test parity of zero."""
-        response = client.get("/api/parity/0")
-        assert response.status_code == 200
-        assert response.json["is_even"] is True
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/api/square?n=5", 25),
+            ("/api/square?n=0", 0),
+            ("/api/square?n=-5", 25),
+            ("/api/abs?n=5", 5),
+            ("/api/abs?n=-5", 5),
+            ("/api/abs?n=0", 0),
+        ],
+    )
+    def test_single_number_result(self, client, path, expected):
+        """Test square and absolute value results."""
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.json["result"] == expected
+
+    @pytest.mark.parametrize(
+        "path", ["/api/square?n=abc", "/api/square", "/api/abs?n=abc", "/api/abs"]
+    )
+    def test_single_number_bad_param_returns_400(self, client, path):
+        """Test invalid or missing n returns a 400 error."""
+        response = client.get(path)
+        _assert_error(response)
+
+    @pytest.mark.parametrize("path", ["/api/square?n=5", "/api/abs?n=-5"])
+    def test_single_number_includes_operation(self, client, path):
+        """Test square and abs responses include operation."""
+        response = client.get(path)
+        assert "operation" in response.json
 
-    def test_parity_negative_even(self, client):
+    @pytest.mark.parametrize(
+        "n, is_even, parity",
+        [(4, True, "even"), (5, False, "odd"), (3, False, "odd"), (0, True, "even")],
+    )
+    def test_parity_endpoint(self, client, n, is_even, parity):
+        """Test parity check for even and odd numbers."""
+        response = client.get(f"/api/parity/{n}")
+        data = response.json
+        assert response.status_code == 200
+        assert data["is_even"] is is_even
+        assert data["is_odd"] is not is_even
+        assert data["parity"] == parity
+
+    @pytest.mark.parametrize("path", ["/api/parity", "/api/odd_even"])
+    def test_precomputed_and_dynamic_bodies_match(self, client, path):
+        """Test table-served inputs match the dynamically built response."""
+        cached = client.get(f"{path}/256").json
+        dynamic = client.get(f"{path}/258").json
+        assert list(cached) == list(dynamic)
+        assert cached["input"] == 256
+        assert dynamic["input"] == 258
+        assert cached["is_even"] is dynamic["is_even"] is True
+
+    @pytest.mark.parametrize("path", ["/api/parity/1001", "/api/odd_even/1001"])
+    def test_dynamic_odd_input(self, client, path):
+        """Test inputs outside the precomputed table report parity correctly."""
+        response = client.get(path)
+        data = response.json
+        assert response.status_code == 200
+        assert data["is_even"] is False
+        assert data["is_odd"] is True
+
+    def test_odd_even_endpoint_status(self, client):
+        """Test odd_even endpoint reports its status field."""
+        response = client.get("/api/odd_even/7")
+        data = response.json
+        assert response.status_code == 200
+        assert data["operation"] == "Odd/Even Check"
+        assert data["status"] == "odd"
+
+    @pytest.mark.parametrize("n, key", [(-4, "is_even"), (-3, "is_odd")])
+    def test_parity_negative(self, client, n, key):
         """Test parity endpoint with negative numbers (path parameter)."""
-        # Negative numbers in URL path may not work - test as expected
-        response = client.get("/api/parity/-4")
+        response = client.get(f"/api/parity/{n}")
         # Accept 404 if negative numbers not supported in path
         assert response.status_code in [200, 404]
         if response.status_code == 200:
-            assert response.json["is_even"] is True
-
-    def test_parity_negative_odd(self, client):
-        """Test parity endpoint with negative odd numbers."""
-        response = client.get("/api/parity/-3")
-        # Accept 404 if negative numbers not supported in path
-        assert response.status_code in [200, 404]
-        if response.status_code == 200:
-            assert response.json["is_odd"] is True
-
-    def test_square_includes_operation(self, client):
-        """Test square response includes operation."""
-        response = client.get("/api/square?n=5")
-        assert "operation" in response.json
-
-    def test_abs_includes_operation(self, client):
-        """Test abs response includes operation."""
-        response = client.get("/api/abs?n=-5")
-        assert "operation" in response.json
+            assert response.json[key] is True
 
 
 class TestEchoEndpoint:
@@ -475,9 +418,7 @@ class TestEchoEndpoint:
 
     def test_echo_post_with_json(self, client):
         """Test echo endpoint via POST with JSON."""
-        response = client.post(
-            "/api/echo", data=json.dumps({"message": "hello"}), content_type="application/json"
-        )
+        response = client.post("/api/echo", json={"message": "hello"})
         assert response.status_code == 200
         assert response.json["message"] == "hello"
 
@@ -504,6 +445,23 @@ class TestEchoEndpoint:
         response = client.post("/api/echo", data="invalid json", content_type="application/json")
         assert response.status_code == 400 or response.status_code == 200
 
+    def test_echo_post_invalid_json_returns_error(self, client):
+        """Test echo POST with malformed JSON returns a JSON error."""
+        response = client.post("/api/echo", data="{not json", content_type="application/json")
+        _assert_error(response)
+
+    def test_echo_post_non_object_json(self, client):
+        """Test echo POST with a JSON array echoes an empty message."""
+        response = client.post("/api/echo", data="[1, 2]", content_type="application/json")
+        assert response.status_code == 200
+        assert response.json["message"] == ""
+
+    def test_echo_post_empty_body(self, client):
+        """Test echo POST without a body echoes an empty message."""
+        response = client.post("/api/echo", content_type="application/json")
+        assert response.status_code == 200
+        assert response.json["message"] == ""
+
     def test_echo_includes_timestamp(self, client):
         """Test echo response includes timestamp."""
         response = client.get("/api/echo?message=test")
@@ -516,126 +474,108 @@ class TestErrorHandling:
     def test_404_not_found(self, client):
         """Test 404 error handling."""
         response = client.get("/api/nonexistent")
-        assert response.status_code == 404
-        assert "error" in response.json
+        _assert_error(response, 404)
 
     def test_405_method_not_allowed(self, client):
         """Test 405 method not allowed."""
         response = client.post("/")
         assert response.status_code == 405
 
+    def test_405_returns_json_error(self, client):
+        """Test 405 error body is JSON with error and status."""
+        response = client.post("/")
+        data = response.json
+        assert data["error"] == "Method not allowed"
+        assert data["status"] == 405
+
+    def test_500_handler_returns_json_error(self, main):
+        """Test 500 handler builds a JSON error response."""
+        with main.app.test_request_context():
+            response = main.internal_server_error(None)
+        assert response.status_code == 500
+        assert json.loads(response.data)["error"] == "Internal server error"
+
     # NEW: Comprehensive error tests
     def test_404_includes_message(self, client):
         """Test 404 error includes message."""
         response = client.get("/api/doesnotexist")
-        assert response.status_code == 404
-        assert "error" in response.json
-        assert isinstance(response.json["error"], str)
+        data = _assert_error(response, 404)
+        assert isinstance(data["error"], str)
 
-    def test_invalid_endpoint_variations(self, client):
+    @pytest.mark.parametrize(
+        "endpoint", ["/api/invalid", "/invalid", "/api/", "/api/add/extra/path"]
+    )
+    def test_invalid_endpoint_variations(self, client, endpoint):
         """Test various invalid endpoints."""
-        endpoints = ["/api/invalid", "/invalid", "/api/", "/api/add/extra/path"]
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert response.status_code in [404, 400]
-
-    def test_error_response_is_json(self, client):
-        """Test error responses are JSON."""
-        response = client.get("/api/nonexistent")
-        assert response.content_type == "application/json"
+        response = client.get(endpoint)
+        assert response.status_code in [404, 400]
 
     def test_method_not_allowed_on_health(self, client):
         """Test method not allowed on health endpoint."""
         response = client.delete("/api/health")
         assert response.status_code == 405
 
+    def test_unknown_math_operation_returns_404(self, client):
+        """Test operations outside the dispatch table are not routed."""
+        response = client.get("/api/modulo?a=5&b=3")
+        assert response.status_code == 404
+        assert response.json["error"] == "Endpoint not found"
+
     def test_method_not_allowed_on_add(self, client):
         """Test method not allowed on add endpoint."""
         response = client.post("/api/add?a=5&b=3")
         assert response.status_code == 405
 
-    def test_invalid_parameter_types_comprehensive(self, client):
+    @pytest.mark.parametrize("endpoint, expected_status", INVALID_PARAM_CASES)
+    def test_invalid_parameter_types_comprehensive(self, client, endpoint, expected_status):
         """Test invalid parameter types across endpoints."""
-        test_cases = [
-            ("/api/add?a=text&b=5", 400),
-            ("/api/subtract?a=5&b=text", 400),
-            ("/api/multiply?a=text&b=text", 400),
-            ("/api/divide?a=5&b=text", 400),
-            ("/api/square?n=text", 400),
-            ("/api/abs?n=text", 400),
-        ]
-        for endpoint, expected_status in test_cases:
-            response = client.get(endpoint)
-            assert response.status_code == expected_status
-            assert "error" in response.json
+        response = client.get(endpoint)
+        _assert_error(response, expected_status)
 
 
 class TestResponseFormats:
     """Tests for response format consistency."""
 
-    def test_all_responses_are_json(self, client):
-        """Test all endpoints return JSON."""
-        response = client.get("/")
+    @pytest.mark.parametrize("endpoint", ["/", "/api/health", "/api/info", "/api/add?a=1&b=2"])
+    def test_responses_include_timestamp(self, client, endpoint):
+        """Test responses include timestamp."""
+        response = client.get(endpoint)
+        assert "timestamp" in response.json
+
+    @pytest.mark.parametrize("endpoint", JSON_ENDPOINTS + ERROR_ENDPOINTS)
+    def test_all_endpoints_return_json_content_type(self, client, endpoint):
+        """Test success and error responses all have a JSON content type."""
+        response = client.get(endpoint)
         assert response.content_type == "application/json"
 
-    def test_responses_include_timestamp(self, client):
-        """Test responses include timestamp."""
-        endpoints = ["/", "/api/health", "/api/info", "/api/add?a=1&b=2"]
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert "timestamp" in response.json
-
-    # NEW: Additional format tests
-    def test_all_endpoints_return_json_content_type(self, client):
-        """Test all endpoints return JSON content type."""
-        endpoints = [
-            "/",
-            "/api/health",
-            "/api/info",
-            "/api/add?a=1&b=2",
-            "/api/subtract?a=5&b=3",
-            "/api/multiply?a=2&b=3",
-            "/api/divide?a=6&b=2",
-            "/api/square?n=5",
-            "/api/abs?n=-5",
-            "/api/parity/4",
-            "/api/echo?message=test",
-        ]
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert response.content_type == "application/json"
-
-    def test_success_responses_have_result_or_status(self, client):
-        """Test success responses have result or status."""
-        endpoints = [
+    @pytest.mark.parametrize(
+        "endpoint, key",
+        [
             ("/", "status"),
             ("/api/health", "status"),
             ("/api/add?a=1&b=2", "result"),
             ("/api/subtract?a=5&b=3", "result"),
-        ]
-        for endpoint, key in endpoints:
-            response = client.get(endpoint)
-            assert key in response.json
+        ],
+    )
+    def test_success_responses_have_result_or_status(self, client, endpoint, key):
+        """Test success responses have result or status."""
+        response = client.get(endpoint)
+        assert key in response.json
 
-    def test_error_responses_have_error_key(self, client):
+    @pytest.mark.parametrize(
+        "endpoint", ["/api/add?a=invalid&b=5", "/api/divide?a=5&b=0", "/api/nonexistent"]
+    )
+    def test_error_responses_have_error_key(self, client, endpoint):
         """Test error responses include error key."""
-        error_endpoints = ["/api/add?a=invalid&b=5", "/api/divide?a=5&b=0", "/api/nonexistent"]
-        for endpoint in error_endpoints:
-            response = client.get(endpoint)
-            if response.status_code >= 400:
-                assert "error" in response.json
+        response = client.get(endpoint)
+        if response.status_code >= 400:
+            assert "error" in response.json
 
-    def test_operation_responses_include_operation_field(self, client):
+    @pytest.mark.parametrize("endpoint", OPERATION_ENDPOINTS)
+    def test_operation_responses_include_operation_field(self, client, endpoint):
         """Test operation responses include operation field."""
-        endpoints = [
-            "/api/add?a=1&b=2",
-            "/api/subtract?a=5&b=3",
-            "/api/multiply?a=2&b=3",
-            "/api/divide?a=6&b=2",
-        ]
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert "operation" in response.json
+        response = client.get(endpoint)
+        assert "operation" in response.json
 
 
 class TestEdgeCases:
@@ -692,31 +632,104 @@ class TestEdgeCases:
         assert response.json["result"] == 999999
 
 
+@pytest.mark.usefixtures("gc_paused")
 class TestConcurrentRequests:
-    """Tests for handling multiple concurrent scenarios."""
+    """Tests for handling concurrent request bursts."""
 
-    def test_multiple_sequential_requests(self, client):
-        """Test multiple sequential requests."""
-        for i in range(10):
-            response = client.get(f"/api/add?a={i}&b=1")
+    def test_concurrent_add_requests(self, flask_app):
+        """Test concurrent add requests each get their own result."""
+        responses = _burst(flask_app, ["/api/add"] * 10, [{"a": i, "b": 1} for i in range(10)])
+        for i, response in enumerate(responses):
             assert response.status_code == 200
             assert response.json["result"] == i + 1
 
-    def test_alternating_endpoints(self, client):
-        """Test alternating between different endpoints."""
-        endpoints = [
-            "/api/add?a=1&b=2",
-            "/api/subtract?a=5&b=3",
-            "/api/multiply?a=2&b=3",
-            "/api/divide?a=6&b=2",
-        ]
-        for endpoint in endpoints * 3:
-            response = client.get(endpoint)
-            assert response.status_code == 200
+    def test_alternating_endpoints(self, flask_app):
+        """Test a concurrent mix of different endpoints."""
+        responses = _burst(flask_app, OPERATION_ENDPOINTS * 3)
+        assert [response.status_code for response in responses] == [200] * 12
 
-    def test_rapid_health_checks(self, client):
-        """Test rapid health check requests."""
-        for _ in range(20):
-            response = client.get("/api/health")
+    def test_rapid_health_checks(self, flask_app):
+        """Test a burst of concurrent health check requests."""
+        for response in _burst(flask_app, ["/api/health"] * 20):
             assert response.status_code == 200
             assert response.json["status"] == "healthy"
+
+
+class TestJsonProvider:
+    """Tests for the orjson-backed JSON provider."""
+
+    def test_app_uses_orjson_provider(self, main):
+        """Test the app serializes through the orjson provider."""
+        assert isinstance(main.app.json, main.OrjsonProvider)
+
+    def test_response_is_compact_json(self, client):
+        """Test responses are encoded without extra whitespace."""
+        response = client.get("/api/add?a=5&b=3")
+        assert b": " not in response.data
+        assert response.json["result"] == 8
+
+    def test_integer_wider_than_64_bits(self, client):
+        """Test results beyond orjson's integer range fall back to stdlib json."""
+        response = client.get("/api/multiply?a=99999999999&b=99999999999")
+        assert response.status_code == 200
+        assert json.loads(response.data)["result"] == 99999999999 * 99999999999
+
+    def test_request_integer_wider_than_64_bits(self, client):
+        """Test wide integers in a JSON body are decoded exactly, not as floats."""
+        wide = 10**23
+        response = client.post("/api/list/sort", json={"numbers": [3, 1, wide]})
+        assert response.status_code == 200
+        assert json.loads(response.data)["result"] == [1, 3, wide]
+
+    def test_echo_integer_wider_than_64_bits(self, client):
+        """Test a wide integer message is echoed back exactly."""
+        wide = 10**23
+        response = client.post("/api/echo", json={"message": wide})
+        assert json.loads(response.data)["message"] == wide
+
+
+class TestTimestampSuffix:
+    """Tests for the cached timestamp encoding of pre-serialized responses."""
+
+    def test_suffix_reencoded_only_when_time_changes(self, main, monkeypatch):
+        """Test the encoded timestamp is reused until get_current_time changes."""
+        first = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        second = datetime(2024, 1, 1, 12, 0, 0, 100000, tzinfo=timezone.utc)
+        now = [first]
+        monkeypatch.setattr(main, "get_current_time", lambda: now[0])
+        monkeypatch.setattr(main, "_ts_suffix", [None, b""])
+
+        suffix = main._timestamp_suffix()
+        assert suffix == b'"2024-01-01T12:00:00Z"}'
+        assert main._timestamp_suffix() is suffix
+
+        now[0] = second
+        assert main._timestamp_suffix() == b'"2024-01-01T12:00:00.100000Z"}'
+
+
+class TestCors:
+    """Tests for the CORS configuration."""
+
+    def test_api_responses_allow_any_origin(self, client):
+        """Test /api/* responses carry the CORS header."""
+        response = client.get("/api/health", headers={"Origin": "http://localhost:3000"})
+        assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:3000"
+
+    def test_root_health_check_is_not_cors_enabled(self, client):
+        """Test routes outside /api/* are left alone."""
+        response = client.get("/", headers={"Origin": "http://localhost:3000"})
+        assert "Access-Control-Allow-Origin" not in response.headers
+
+    def test_preflight_is_cacheable(self, client):
+        """Test the echo preflight is answered and cacheable for a day."""
+        response = client.options(
+            "/api/echo",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "Content-Type",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["Access-Control-Max-Age"] == "86400"
+        assert "POST" in response.headers["Access-Control-Allow-Methods"]
@@ -1,8 +1,15 @@
 """
 Unit tests for utility functions.
 Comprehensive tests including edge cases and error conditions.
+
+The assertions here are plain scalar comparisons, so pytest's assertion
+rewriting is turned off for this module: PYTEST_DONT_REWRITE
 """
 
+import time
+from datetime import datetime, timedelta
+
+import orjson
 import pytest
 
 from app.utils import (
@@ -13,7 +20,10 @@ from app.utils import (
     get_current_time,
     is_even,
     is_odd,
+    is_palindrome,
     multiply_numbers,
+    parse_int,
+    sort_list,
     square,
     subtract_numbers,
 )
@@ -22,256 +32,290 @@ from app.utils import (
 class TestGetCurrentTime:
     """Tests for get_current_time function."""
 
-    def test_returns_string(self):
-        """Test that function returns string."""
+    def test_returns_datetime(self):
+        """Test that function returns a datetime."""
         result = get_current_time()
-        assert isinstance(result, str)
+        assert isinstance(result, datetime)
 
-    def test_returns_iso_format(self):
-        """Test that timestamp is in ISO format."""
+    def test_returns_utc(self):
+        """Test that the datetime is timezone-aware UTC."""
         result = get_current_time()
-        assert "T" in result  # ISO format has T separator
-        assert len(result) > 0
+        assert result.utcoffset() == timedelta(0)
 
-    def test_contains_digits(self):
-        """Test that timestamp contains digits."""
-        result = get_current_time()
-        assert any(c.isdigit() for c in result)
+    def test_serializes_to_iso_format(self):
+        """Test that the JSON encoding is an ISO timestamp with Z suffix."""
+        result = orjson.dumps(get_current_time(), option=orjson.OPT_UTC_Z).decode()
+        assert "T" in result  # ISO format has T separator
+        assert result.endswith('Z"')
+
+    def test_reuses_value_within_tick(self, monkeypatch):
+        """Test that calls within one 100ms tick return the same cached datetime."""
+        monkeypatch.setattr(time, "time", lambda: 1700000000.01)
+        first = get_current_time()
+        monkeypatch.setattr(time, "time", lambda: 1700000000.09)
+        assert get_current_time() is first
+
+    def test_refreshes_on_next_tick(self, monkeypatch):
+        """Test that a new tick produces a new timestamp."""
+        monkeypatch.setattr(time, "time", lambda: 1700000000.05)
+        first = get_current_time()
+        monkeypatch.setattr(time, "time", lambda: 1700000000.15)
+        assert get_current_time() > first
+
+
+class TestParseInt:
+    """Tests for parse_int function."""
+
+    def test_parses_integer_strings(self):
+        """Test parsing positive and negative integers."""
+        assert parse_int("42") == 42
+        assert parse_int("-7") == -7
+
+    def test_repeated_strings_hit_cache(self):
+        """Test a repeated string is served from the cache."""
+        parse_int.cache_clear()
+        parse_int("5")
+        parse_int("5")
+        assert parse_int.cache_info().hits == 1
+
+    def test_raises_error_for_invalid_string(self):
+        """Test that invalid strings still raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_int("abc")
+        with pytest.raises(ValueError):
+            parse_int("1.5")
 
 
 class TestAddNumbers:
     """Tests for add_numbers function."""
 
-    def test_add_positive_integers(self):
-        """Test adding positive integers."""
-        assert add_numbers(5, 3) == 8
-
-    def test_add_negative_integers(self):
-        """Test adding negative integers."""
-        assert add_numbers(-5, -3) == -8
-
-    def test_add_mixed_signs(self):
-        """Test adding numbers with different signs."""
-        assert add_numbers(10, -7) == 3
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (5, 3, 8),  # positive integers
+            (-5, -3, -8),  # negative integers
+            (10, -7, 3),  # mixed signs
+            (5, 0, 5),  # zero
+            (2.5, 1.5, 4.0),  # floats
+            (999999, 1, 1000000),  # large numbers
+        ],
+    )
+    def test_add(self, a, b, expected):
+        """Test adding valid numbers."""
+        assert add_numbers(a, b) == expected
 
-    def test_add_with_zero(self):
-        """Test adding with zero."""
-        assert add_numbers(5, 0) == 5
+    def test_add_int_subclass(self):
+        """Test that int subclasses take the validated slow path."""
 
-    def test_add_floats(self):
-        """Test adding float numbers."""
-        assert add_numbers(2.5, 1.5) == 4.0
+        class Count(int):
+            """Minimal int subclass."""
 
-    def test_add_large_numbers(self):
-        """Test adding large numbers."""
-        assert add_numbers(999999, 1) == 1000000
-
-    def test_add_raises_error_for_none(self):
-        """Test error when adding None."""
-        with pytest.raises(ValueError):
-            add_numbers(None, 5)
-
-    def test_add_raises_error_for_string(self):
-        """Test error when adding string."""
-        with pytest.raises(ValueError):
-            add_numbers("5", 3)
-
-    def test_add_raises_error_for_bool(self):
-        """Test error when using boolean."""
-        with pytest.raises(ValueError):
-            add_numbers(True, 5)
+        assert add_numbers(Count(5), 3) == 8
 
 
 class TestSubtractNumbers:
     """Tests for subtract_numbers function."""
 
-    def test_subtract_positive_integers(self):
-        """Test subtracting positive integers."""
-        assert subtract_numbers(10, 3) == 7
-
-    def test_subtract_negative_integers(self):
-        """Test subtracting negative integers."""
-        assert subtract_numbers(-10, -3) == -7
-
-    def test_subtract_results_negative(self):
-        """Test subtraction resulting in negative."""
-        assert subtract_numbers(3, 10) == -7
-
-    def test_subtract_floats(self):
-        """Test subtracting floats."""
-        assert subtract_numbers(5.5, 2.5) == 3.0
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (10, 3, 7),  # positive integers
+            (-10, -3, -7),  # negative integers
+            (3, 10, -7),  # negative result
+            (5.5, 2.5, 3.0),  # floats
+        ],
+    )
+    def test_subtract(self, a, b, expected):
+        """Test subtracting valid numbers."""
+        assert subtract_numbers(a, b) == expected
 
 
 class TestMultiplyNumbers:
     """Tests for multiply_numbers function."""
 
-    def test_multiply_positive_integers(self):
-        """Test multiplying positive integers."""
-        assert multiply_numbers(5, 3) == 15
-
-    def test_multiply_by_zero(self):
-        """Test multiplying by zero."""
-        assert multiply_numbers(100, 0) == 0
-
-    def test_multiply_negative_numbers(self):
-        """Test multiplying negative numbers."""
-        assert multiply_numbers(-5, -3) == 15
-
-    def test_multiply_mixed_signs(self):
-        """Test multiplying with different signs."""
-        assert multiply_numbers(-5, 3) == -15
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (5, 3, 15),  # positive integers
+            (100, 0, 0),  # zero
+            (-5, -3, 15),  # negative numbers
+            (-5, 3, -15),  # mixed signs
+        ],
+    )
+    def test_multiply(self, a, b, expected):
+        """Test multiplying valid numbers."""
+        assert multiply_numbers(a, b) == expected
 
 
 class TestDivideNumbers:
     """Tests for divide_numbers function."""
 
-    def test_divide_positive_integers(self):
-        """Test dividing positive integers."""
-        assert divide_numbers(10, 2) == 5.0
-
-    def test_divide_with_float_result(self):
-        """Test division with float result."""
-        result = divide_numbers(10, 3)
-        assert abs(result - 3.333) < 0.01
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (10, 2, 5.0),  # positive integers
+            (10, 3, pytest.approx(3.333, abs=0.01)),  # float result
+            (-10, 2, -5.0),  # negative numbers
+        ],
+    )
+    def test_divide(self, a, b, expected):
+        """Test dividing valid numbers."""
+        assert divide_numbers(a, b) == expected
 
     def test_divide_by_zero_raises_error(self):
         """Test that dividing by zero raises error."""
         with pytest.raises(ZeroDivisionError):
             divide_numbers(10, 0)
 
-    def test_divide_negative_numbers(self):
-        """Test dividing negative numbers."""
-        assert divide_numbers(-10, 2) == -5.0
-
-    def test_divide_raises_error_for_string(self):
-        """Test error when dividing by string."""
-        with pytest.raises(ValueError):
-            divide_numbers(10, "2")
-
 
 class TestIsEven:
     """Tests for is_even function."""
 
-    def test_even_numbers_return_true(self):
-        """Test that even numbers return True."""
-        assert is_even(4) is True
-        assert is_even(0) is True
-        assert is_even(-4) is True
+    @pytest.mark.parametrize(
+        "n, expected",
+        [(4, True), (0, True), (-4, True), (3, False), (1, False), (-3, False)],
+    )
+    def test_is_even(self, n, expected):
+        """Test even numbers return True and odd numbers False."""
+        assert is_even(n) is expected
 
-    def test_odd_numbers_return_false(self):
-        """Test that odd numbers return False."""
-        assert is_even(3) is False
-        assert is_even(1) is False
-        assert is_even(-3) is False
 
-    def test_raises_error_for_float(self):
-        """Test error when checking float."""
-        with pytest.raises(ValueError):
-            is_even(4.5)
+class TestIsOdd:
+    """Tests for is_odd function."""
 
-    def test_raises_error_for_string(self):
-        """Test error when checking string."""
-        with pytest.raises(ValueError):
-            is_even("4")
+    @pytest.mark.parametrize(
+        "n, expected",
+        [(3, True), (1, True), (-3, True), (4, False), (0, False), (-4, False)],
+    )
+    def test_is_odd(self, n, expected):
+        """Test odd numbers return True and even numbers False."""
+        assert is_odd(n) is expected
 
 
-class TestIsOdd:
-    """Tests for is_odd function."""
+class TestEvenParity:
+    """
+    Tests for even_parity function (binary parity check).
+    Even parity = even count of 1-bits in the binary representation of |n|.
+    """
+
+    @pytest.mark.parametrize(
+        "n, expected",
+        [
+            (3, True),  # 0b11 → 2 ones → even
+            (0, True),  # 0b0 → 0 ones → even
+            (5, True),  # 0b101 → 2 ones → even
+            (6, True),  # 0b110 → 2 ones → even
+            (4, False),  # 0b100 → 1 one → odd
+            (2, False),  # 0b10 → 1 one → odd
+            (1, False),  # 0b1 → 1 one → odd
+            (7, False),  # 0b111 → 3 ones → odd
+            (2**64 + 1, True),  # wider than 64 bits, two 1-bits
+            (2**100, False),  # one 1-bit
+            ((1 << 65) - 1, False),  # 65 1-bits
+            (-3, True),  # |-3| = 0b11 → 2 ones → even
+            (-4, False),  # |-4| = 0b100 → 1 one → odd
+            (-(2**64 + 1), True),
+        ],
+    )
+    def test_even_parity(self, n, expected):
+        """Test parity of small, wide and negative integers."""
+        assert even_parity(n) is expected
 
-    def test_odd_numbers_return_true(self):
-        """Test that odd numbers return True."""
-        assert is_odd(3) is True
-        assert is_odd(1) is True
-        assert is_odd(-3) is True
 
-    def test_even_numbers_return_false(self):
-        """Test that even numbers return False."""
-        assert is_odd(4) is False
-        assert is_odd(0) is False
-        assert is_odd(-4) is False
+class TestSquare:
+    """Tests for square function."""
 
-    def test_raises_error_for_float(self):
-        """Test error when checking float."""
-        with pytest.raises(ValueError):
-            is_odd(3.5)
+    @pytest.mark.parametrize("n, expected", [(5, 25), (-5, 25), (0, 0), (2.5, 6.25)])
+    def test_square(self, n, expected):
+        """Test squaring positive, negative, zero and float values."""
+        assert square(n) == expected
 
 
-class TestEvenParity:
-    """Tests for even_parity function (binary parity check)."""
-
-    def test_even_parity_return_true(self):
-        """
-        Test that numbers with even parity return True.
-        Even parity = even count of 1-bits in binary representation.
-        3 = 0b11 (two 1s) → even parity → True
-        0 = 0b0 (zero 1s) → even parity → True
-        """
-        assert even_parity(3) is True  # 0b11 → 2 ones → even
-        assert even_parity(0) is True  # 0b0 → 0 ones → even
-        assert even_parity(5) is True  # 0b101 → 2 ones → even
-        assert even_parity(6) is True  # 0b110 → 2 ones → even
-
-    def test_even_parity_return_false(self):
-        """
-        Test that numbers with odd parity return False.
-        Odd parity = odd count of 1-bits in binary representation.
-        4 = 0b100 (one 1) → odd parity → False
-        2 = 0b10 (one 1) → odd parity → False
-        """
-        assert even_parity(4) is False  # 0b100 → 1 one → odd
-        assert even_parity(2) is False  # 0b10 → 1 one → odd
-        assert even_parity(1) is False  # 0b1 → 1 one → odd
-        assert even_parity(7) is False  # 0b111 → 3 ones → odd
-
-    def test_raises_error_for_float(self):
-        """Test error when checking float."""
-        with pytest.raises(ValueError):
-            even_parity(2.5)
+class TestAbsoluteValue:
+    """Tests for absolute_value function."""
 
-    def test_raises_error_for_string(self):
-        """Test error when checking string."""
+    @pytest.mark.parametrize("n, expected", [(5, 5), (-5, 5), (0, 0), (-2.5, 2.5)])
+    def test_absolute_value(self, n, expected):
+        """Test absolute value of positive, negative, zero and float values."""
+        assert absolute_value(n) == expected
+
+
+class TestInputValidation:
+    """
+    Check every numeric function is wired to its validator.
+    The validators themselves are covered in test_validators.py.
+    """
+
+    @pytest.mark.parametrize(
+        "func, args",
+        [
+            (add_numbers, (None, 5)),
+            (subtract_numbers, ("5", 3)),
+            (multiply_numbers, (True, 5)),
+            (divide_numbers, (10, "2")),
+            (is_even, (4.5,)),
+            (is_odd, (False,)),
+            (even_parity, ("2",)),
+            (square, ("5",)),
+            (absolute_value, (None,)),
+        ],
+    )
+    def test_rejects_invalid_input(self, func, args):
+        """Test that invalid input raises ValueError."""
         with pytest.raises(ValueError):
-            even_parity("2")
+            func(*args)
 
 
-class TestSquare:
-    """Tests for square function."""
+class TestIsPalindrome:
+    """Tests for is_palindrome function."""
 
-    def test_square_positive_number(self):
-        """Test squaring positive number."""
-        assert square(5) == 25
+    def test_simple_palindrome(self):
+        """Test a plain palindrome."""
+        assert is_palindrome("madam") is True
 
-    def test_square_negative_number(self):
-        """Test squaring negative number."""
-        assert square(-5) == 25
+    def test_ignores_case_and_punctuation(self):
+        """Test that case, spaces and punctuation are ignored."""
+        assert is_palindrome("A man, a plan, a canal: Panama") is True
 
-    def test_square_zero(self):
-        """Test squaring zero."""
-        assert square(0) == 0
+    def test_not_palindrome(self):
+        """Test a non-palindrome."""
+        assert is_palindrome("hello") is False
 
-    def test_square_float(self):
-        """Test squaring float."""
-        assert square(2.5) == 6.25
+    def test_unicode_letters_are_kept(self):
+        """Test that non-ASCII letters still count as alphanumeric."""
+        assert is_palindrome("Ésé!") is True
+        assert is_palindrome("Éso") is False
 
+    def test_raises_error_for_non_string(self):
+        """Test error when checking a non-string."""
+        with pytest.raises(ValueError):
+            is_palindrome(121)
 
-class TestAbsoluteValue:
-    """Tests for absolute_value function."""
 
-    def test_absolute_positive_number(self):
-        """Test absolute value of positive number."""
-        assert absolute_value(5) == 5
+class TestSortList:
+    """Tests for sort_list function."""
+
+    def test_sort_mixed_numbers(self):
+        """Test sorting ints and floats together."""
+        assert sort_list([3, 1.5, -2, 0]) == [-2, 0, 1.5, 3]
+
+    def test_sort_reverse(self):
+        """Test sorting in descending order."""
+        assert sort_list([1, 3, 2], reverse=True) == [3, 2, 1]
 
-    def test_absolute_negative_number(self):
-        """Test absolute value of negative number."""
-        assert absolute_value(-5) == 5
+    def test_sort_keeps_int_subclasses(self):
+        """Test that int subclasses such as bool are still accepted."""
+        assert sort_list([2, True, 0]) == [0, True, 2]
 
-    def test_absolute_zero(self):
-        """Test absolute value of zero."""
-        assert absolute_value(0) == 0
+    def test_raises_error_for_non_numeric_element(self):
+        """Test error when the list contains a non-number."""
+        with pytest.raises(ValueError, match="only numbers"):
+            sort_list([1, "2", 3])
 
-    def test_absolute_float(self):
-        """Test absolute value of float."""
-        assert absolute_value(-2.5) == 2.5
+    def test_raises_error_for_non_list(self):
+        """Test error when the input is not a list."""
+        with pytest.raises(ValueError, match="must be a list"):
+            sort_list((1, 2))
 
 
 class TestIntegrationScenarios:
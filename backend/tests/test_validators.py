@@ -0,0 +1,68 @@
+"""
+Unit tests for the input validators shared by the utility functions.
+Each validator is tested once here; test_utils.py only checks that every
+public function is wired to one.
+"""
+
+# pylint: disable=protected-access
+
+import pytest
+
+from app import utils
+
+
+class TestCheckNumbers:
+    """Tests for the two-operand validator used by the arithmetic helpers."""
+
+    @pytest.mark.parametrize("a, b", [(5, 3), (2.5, -1), (0, 0.0)])
+    def test_accepts_numbers(self, a, b):
+        """Test that int and float pairs pass."""
+        assert utils._check_numbers(a, b) is None
+
+    @pytest.mark.parametrize(
+        "a, b, message",
+        [
+            (None, 5, "integers or floats"),
+            ("5", 3, "integers or floats"),
+            (5, [], "integers or floats"),
+            (True, 5, "Boolean"),
+            (5, False, "Boolean"),
+        ],
+    )
+    def test_rejects(self, a, b, message):
+        """Test that non-numbers and booleans raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            utils._check_numbers(a, b)
+
+
+class TestValidateNumber:
+    """Tests for the single-number validator."""
+
+    @pytest.mark.parametrize("n", [5, -2.5, 0])
+    def test_accepts_numbers(self, n):
+        """Test that ints and floats pass."""
+        assert utils._validate_number(n) is None
+
+    @pytest.mark.parametrize("bad", [None, "5", True, [], {}])
+    def test_rejects(self, bad):
+        """Test that non-numbers and booleans raise ValueError."""
+        with pytest.raises(ValueError, match="must be a number"):
+            utils._validate_number(bad)
+
+
+class TestValidateInt:
+    """Tests for the integer validator."""
+
+    def test_accepts_int_subclass(self):
+        """Test that int subclasses other than bool pass."""
+
+        class Count(int):
+            """Minimal int subclass."""
+
+        assert utils._validate_int(Count(3)) is None
+
+    @pytest.mark.parametrize("bad", [None, "4", True, 2.5, []])
+    def test_rejects(self, bad):
+        """Test that non-integers and booleans raise ValueError."""
+        with pytest.raises(ValueError, match="must be an integer"):
+            utils._validate_int(bad)